@@ -21,6 +21,7 @@ import {
   calculateCorrelationAnalytics,
   calculateCorrelationMatrix,
   CorrelationAlignment,
+  CorrelationAnalytics,
   CorrelationDateBasis,
   CorrelationMethod,
   CorrelationMatrix,
@@ -35,6 +36,19 @@ import { useTheme } from "next-themes";
 import type { Data, Layout } from "plotly.js";
 import { useCallback, useEffect, useMemo, useState } from "react";
 
+// Matrices already computed for a loaded trade set, keyed by settings, so
+// switching back to a previous method/alignment is a lookup. Entries go away
+// with the trades array they were computed from.
+const correlationCache = new WeakMap<
+  Trade[],
+  Map<string, { matrix: CorrelationMatrix; stats: CorrelationAnalytics }>
+>();
+
+// Shared placeholder figure so the empty state keeps stable references
+// and doesn't retrigger the chart wrapper's layout/resize work each render
+const EMPTY_PLOT_DATA: Data[] = [];
+const EMPTY_LAYOUT: Partial<Layout> = {};
+
 export default function CorrelationMatrixPage() {
   const { theme } = useTheme();
   const activeBlockId = useBlockStore(
@@ -90,30 +104,46 @@ export default function CorrelationMatrixPage() {
       return { correlationMatrix: null, analytics: null };
     }
 
-    const matrix = calculateCorrelationMatrix(trades, {
-      method,
-      alignment,
-      normalization,
-      dateBasis,
-    });
-    const stats = calculateCorrelationAnalytics(matrix);
+    let resultsForTrades = correlationCache.get(trades);
+    if (!resultsForTrades) {
+      resultsForTrades = new Map();
+      correlationCache.set(trades, resultsForTrades);
+    }
+
+    const cacheKey = [method, alignment, normalization, dateBasis].join("|");
+    let cached = resultsForTrades.get(cacheKey);
+
+    if (!cached) {
+      const matrix = calculateCorrelationMatrix(trades, {
+        method,
+        alignment,
+        normalization,
+        dateBasis,
+      });
+      cached = { matrix, stats: calculateCorrelationAnalytics(matrix) };
+      resultsForTrades.set(cacheKey, cached);
+    }
 
-    return { correlationMatrix: matrix, analytics: stats };
+    return { correlationMatrix: cached.matrix, analytics: cached.stats };
   }, [trades, method, alignment, normalization, dateBasis]);
 
+  // Axis labels only depend on the strategy list, so theme toggles reuse them
+  const truncatedStrategies = useMemo(
+    () =>
+      correlationMatrix
+        ? correlationMatrix.strategies.map((s) => truncateStrategyName(s, 40))
+        : [],
+    [correlationMatrix]
+  );
+
   const { plotData, layout } = useMemo(() => {
     if (!correlationMatrix) {
-      return { plotData: [], layout: {} };
+      return { plotData: EMPTY_PLOT_DATA, layout: EMPTY_LAYOUT };
     }
 
     const { strategies, correlationData } = correlationMatrix;
     const isDark = theme === "dark";
 
-    // Truncate strategy names for axis labels
-    const truncatedStrategies = strategies.map((s) =>
-      truncateStrategyName(s, 40)
-    );
-
     // Create heatmap with better contrast
     // Different colorscales for light and dark modes
     const colorscale = isDark
@@ -139,38 +169,25 @@ export default function CorrelationMatrixPage() {
         ];
 
     const heatmapData = {
+      // Full names are the categories so hover can show them directly;
+      // the axes display the truncated labels via ticktext
       z: correlationData,
-      x: truncatedStrategies,
-      y: truncatedStrategies,
+      x: strategies,
+      y: strategies,
       type: "heatmap" as const,
       colorscale,
       zmid: 0,
       zmin: -1,
       zmax: 1,
-      text: correlationData.map((row) => row.map((val) => val.toFixed(2))) as unknown as string,
-      texttemplate: "%{text}",
+      texttemplate: "%{z:.2f}",
+      // Heatmap textfont.color is not per-cell; Plotly's default "auto" colour
+      // already picks a contrasting colour for each cell
       textfont: {
         size: 10,
-        color: correlationData.map((row) =>
-          row.map((val) => {
-            // Dynamic text color based on value and theme
-            const absVal = Math.abs(val);
-            if (isDark) {
-              // In dark mode, use lighter text for strong correlations
-              return absVal > 0.5 ? "#ffffff" : "#e2e8f0";
-            } else {
-              // In light mode, use white for strong, black for weak
-              return absVal > 0.5 ? "#ffffff" : "#000000";
-            }
-          })
-        ) as unknown as string,
       },
       // Use full strategy names in hover tooltip
       hovertemplate:
-        "<b>%{customdata[0]} ↔ %{customdata[1]}</b><br>Correlation: %{z:.3f}<extra></extra>",
-      customdata: correlationData.map((row, yIndex) =>
-        row.map((_, xIndex) => [strategies[yIndex], strategies[xIndex]])
-      ),
+        "<b>%{y} ↔ %{x}</b><br>Correlation: %{z:.3f}<extra></extra>",
       colorbar: {
         title: { text: "Correlation", side: "right" },
         tickmode: "linear",
@@ -183,12 +200,16 @@ export default function CorrelationMatrixPage() {
       xaxis: {
         side: "bottom",
         tickangle: -45,
-        tickmode: "linear",
+        tickmode: "array",
+        tickvals: strategies,
+        ticktext: truncatedStrategies,
         automargin: true,
       },
       yaxis: {
         autorange: "reversed",
-        tickmode: "linear",
+        tickmode: "array",
+        tickvals: strategies,
+        ticktext: truncatedStrategies,
         automargin: true,
       },
       margin: {
@@ -200,7 +221,7 @@ export default function CorrelationMatrixPage() {
     };
 
     return { plotData: [heatmapData as unknown as Data], layout: heatmapLayout };
-  }, [correlationMatrix, theme]);
+  }, [correlationMatrix, truncatedStrategies, theme]);
 
   const isDark = theme === "dark";
 
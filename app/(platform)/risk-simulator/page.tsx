@@ -1,6 +1,11 @@
 "use client";
 
 import { MultiSelect } from "@/components/multi-select";
+import {
+    CHART_FONT_FAMILY,
+    DARK_CHART_THEME,
+    LIGHT_CHART_THEME,
+} from "@/components/performance-charts/chart-wrapper";
 import {
     DrawdownDistributionChart,
     ReturnDistributionChart,
@@ -32,7 +37,7 @@ import {
 import { Slider } from "@/components/ui/slider";
 import { Switch } from "@/components/ui/switch";
 import {
-    runMonteCarloSimulation,
+    runMonteCarloSimulationAsync,
     type MonteCarloParams,
     type MonteCarloResult,
 } from "@/lib/calculations/monte-carlo";
@@ -56,10 +61,18 @@ import { HelpCircle, Loader2, Play, RotateCcw } from "lucide-react";
 import { useTheme } from "next-themes";
 import dynamic from "next/dynamic";
 import type { Data } from "plotly.js";
-import { useEffect, useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 
 const Plot = dynamic(() => import("react-plotly.js"), { ssr: false });
 
+// Static Plotly props for the equity chart, created once rather than per render
+const EQUITY_CHART_CONFIG = {
+  displayModeBar: true,
+  displaylogo: false,
+  responsive: true,
+};
+const EQUITY_CHART_STYLE = { width: "100%", height: "600px" };
+
 export default function RiskSimulatorPage() {
   const { activeBlockId } = useBlockStore();
 
@@ -98,14 +111,29 @@ export default function RiskSimulatorPage() {
 
   // Simulation state
   const [isRunning, setIsRunning] = useState(false);
+  const [simulationProgress, setSimulationProgress] = useState({
+    completed: 0,
+    total: 0,
+  });
   const [result, setResult] = useState<MonteCarloResult | null>(null);
   const [error, setError] = useState<string | null>(null);
+  const simulationAbortRef = useRef<AbortController | null>(null);
+
+  // Stop any in-flight simulation when leaving the page
+  useEffect(() => {
+    return () => simulationAbortRef.current?.abort();
+  }, []);
 
   // Get available strategies from active block
   const [trades, setTrades] = useState<Trade[]>([]);
   const [dailyLogs, setDailyLogs] = useState<DailyLogEntry[]>([]);
   const availableStrategies = useMemo(() => {
-    const strategies = new Set(trades.map((t) => t.strategy).filter(Boolean));
+    const strategies = new Set<string>();
+    for (const trade of trades) {
+      if (trade.strategy) {
+        strategies.add(trade.strategy);
+      }
+    }
     return Array.from(strategies);
   }, [trades]);
 
@@ -129,16 +157,17 @@ export default function RiskSimulatorPage() {
   const calculatedTradesPerYear = useMemo(() => {
     if (trades.length < 2) return 252; // Default
 
-    // Get date range
-    const sortedTrades = [...trades].sort(
-      (a, b) => a.dateOpened.getTime() - b.dateOpened.getTime()
-    );
-    const firstDate = sortedTrades[0].dateOpened;
-    const lastDate = sortedTrades[sortedTrades.length - 1].dateOpened;
+    // Get date range (bounds only, no need to sort every trade)
+    let firstTime = Infinity;
+    let lastTime = -Infinity;
+    for (const trade of trades) {
+      const openedTime = trade.dateOpened.getTime();
+      if (openedTime < firstTime) firstTime = openedTime;
+      if (openedTime > lastTime) lastTime = openedTime;
+    }
 
     // Calculate years elapsed
-    const daysElapsed =
-      (lastDate.getTime() - firstDate.getTime()) / (1000 * 60 * 60 * 24);
+    const daysElapsed = (lastTime - firstTime) / (1000 * 60 * 60 * 24);
     const yearsElapsed = daysElapsed / 365.25;
 
     if (yearsElapsed < 0.01) return 252; // Too short to calculate
@@ -273,7 +302,13 @@ export default function RiskSimulatorPage() {
       return;
     }
 
+    // A new run supersedes whatever is still in flight
+    simulationAbortRef.current?.abort();
+    const controller = new AbortController();
+    simulationAbortRef.current = controller;
+
     setIsRunning(true);
+    setSimulationProgress({ completed: 0, total: 0 });
     setError(null);
     setResult(null);
 
@@ -281,9 +316,10 @@ export default function RiskSimulatorPage() {
       // Give React a chance to render the loading state before crunching numbers
       await new Promise((resolve) => setTimeout(resolve, 16));
       // Filter trades by selected strategies if any are selected
+      const selected = new Set(selectedStrategies);
       const filteredTrades =
-        selectedStrategies.length > 0
-          ? trades.filter((t) => selectedStrategies.includes(t.strategy || ""))
+        selected.size > 0
+          ? trades.filter((t) => selected.has(t.strategy || ""))
           : trades;
 
       const isStrategyFiltered = filteredTrades.length !== trades.length;
@@ -347,16 +383,38 @@ export default function RiskSimulatorPage() {
         worstCaseSizing,
       };
 
-      const simulationResult = runMonteCarloSimulation(filteredTrades, params);
-      setResult(simulationResult);
+      // Simulate in batches so the loading state can report progress
+      const simulationResult = await runMonteCarloSimulationAsync(
+        filteredTrades,
+        params,
+        {
+          signal: controller.signal,
+          onProgress: (completed, total) => {
+            if (!controller.signal.aborted) {
+              setSimulationProgress({ completed, total });
+            }
+          },
+        }
+      );
+      if (!controller.signal.aborted) {
+        setResult(simulationResult);
+      }
     } catch (err) {
-      setError(err instanceof Error ? err.message : "Simulation failed");
+      if (!controller.signal.aborted) {
+        setError(err instanceof Error ? err.message : "Simulation failed");
+      }
     } finally {
-      setIsRunning(false);
+      if (simulationAbortRef.current === controller) {
+        simulationAbortRef.current = null;
+        setIsRunning(false);
+      }
     }
   };
 
   const resetSimulation = () => {
+    simulationAbortRef.current?.abort();
+    simulationAbortRef.current = null;
+    setIsRunning(false);
     setResult(null);
     setError(null);
   };
@@ -1431,7 +1489,9 @@ export default function RiskSimulatorPage() {
             Generating simulation results...
           </div>
           <p className="text-xs text-muted-foreground">
-            We&apos;ll show updated charts as soon as the calculations finish.
+            {simulationProgress.completed > 0
+              ? `${simulationProgress.completed.toLocaleString()} of ${simulationProgress.total.toLocaleString()} simulations complete`
+              : "We'll show updated charts as soon as the calculations finish."}
           </p>
         </Card>
       ) : result ? (
@@ -1517,46 +1577,106 @@ function EquityCurveChart({
   const { theme } = useTheme();
   const isDark = theme === "dark";
 
-  const { data, layout } = useMemo(() => {
-    const { percentiles, simulations } = result;
+  // Percentile coordinates depend only on the result and capital, so theme
+  // and path toggles reuse these arrays and only restyle the traces below
+  const bands = useMemo(() => {
+    const { percentiles } = result;
 
-    // Convert percentiles to portfolio values
+    // Only the percentile rows are scaled to portfolio values; the full
+    // simulation matrix is never converted
     const toPortfolioValue = (arr: number[]) =>
       arr.map((v) => initialCapital * (1 + v));
 
+    // Band outlines run forward along the lower curve and back along the
+    // upper one; build them in place instead of spreading reversed copies
+    const stepCount = percentiles.steps.length;
+    const bandX: number[] = new Array(stepCount * 2);
+    for (let i = 0; i < stepCount; i++) {
+      bandX[i] = percentiles.steps[i];
+      bandX[stepCount * 2 - 1 - i] = percentiles.steps[i];
+    }
+    const toBandY = (lower: number[], upper: number[]) => {
+      const bandY: number[] = new Array(stepCount * 2);
+      for (let i = 0; i < stepCount; i++) {
+        bandY[i] = initialCapital * (1 + lower[i]);
+        bandY[stepCount * 2 - 1 - i] = initialCapital * (1 + upper[i]);
+      }
+      return bandY;
+    };
+
+    return {
+      steps: percentiles.steps,
+      bandX,
+      p5To95: toBandY(percentiles.p5, percentiles.p95),
+      p25To75: toBandY(percentiles.p25, percentiles.p75),
+      median: toPortfolioValue(percentiles.p50),
+      capitalX: [percentiles.steps[0], percentiles.steps[stepCount - 1]],
+    };
+  }, [result, initialCapital]);
+
+  // Individual paths are only built while they are shown
+  const paths = useMemo(() => {
+    if (!showIndividualPaths) {
+      return null;
+    }
+
+    const { percentiles, simulations } = result;
+    const stepCount = percentiles.steps.length;
+    const pathsToShow = Math.min(20, simulations.length);
+
+    // Draw all paths as one trace, with a null point between paths so
+    // Plotly breaks the line instead of laying out one trace per path
+    const pathX: (number | null)[] = new Array(pathsToShow * (stepCount + 1));
+    const pathY: (number | null)[] = new Array(pathX.length);
+    let point = 0;
+    for (let i = 0; i < pathsToShow; i++) {
+      const equityCurve = simulations[i].equityCurve;
+      for (let step = 0; step < stepCount; step++) {
+        pathX[point] = percentiles.steps[step];
+        pathY[point] = initialCapital * (1 + equityCurve[step]);
+        point++;
+      }
+      pathX[point] = null;
+      pathY[point] = null;
+      point++;
+    }
+
+    return {
+      x: pathX,
+      y: pathY,
+      opacity: Math.max(0.1, Math.min(0.4, 20 / simulations.length)),
+    };
+  }, [result, initialCapital, showIndividualPaths]);
+
+  const data = useMemo(() => {
     const traces: Data[] = [];
 
     // Show individual simulation paths if requested
-    if (showIndividualPaths) {
-      const pathsToShow = Math.min(20, simulations.length);
-      const opacity = Math.max(0.1, Math.min(0.4, 20 / simulations.length));
-
-      for (let i = 0; i < pathsToShow; i++) {
-        traces.push({
-          x: percentiles.steps,
-          y: toPortfolioValue(simulations[i].equityCurve),
-          type: "scatter",
-          mode: "lines",
-          line: {
-            color: isDark
-              ? `rgba(100, 116, 139, ${opacity})`
-              : `rgba(148, 163, 184, ${opacity})`,
-            width: 1,
-          },
-          showlegend: false,
-          hoverinfo: "skip",
-        });
-      }
+    if (paths) {
+      traces.push({
+        x: paths.x,
+        y: paths.y,
+        type: "scattergl",
+        mode: "lines",
+        connectgaps: false,
+        line: {
+          color: isDark
+            ? `rgba(100, 116, 139, ${paths.opacity})`
+            : `rgba(148, 163, 184, ${paths.opacity})`,
+          width: 1,
+        },
+        showlegend: false,
+        hoverinfo: "skip",
+      });
     }
 
+    // Bands and percentile lines render with WebGL (scattergl) so long
+    // horizons stay responsive; the flat reference line stays SVG
     // P5-P95 filled area (light gray)
     traces.push({
-      x: [...percentiles.steps, ...percentiles.steps.slice().reverse()],
-      y: [
-        ...toPortfolioValue(percentiles.p5),
-        ...toPortfolioValue(percentiles.p95).reverse(),
-      ],
-      type: "scatter",
+      x: bands.bandX,
+      y: bands.p5To95,
+      type: "scattergl",
       mode: "none",
       fill: "toself",
       fillcolor: isDark ? "rgba(128,128,128,0.1)" : "rgba(128,128,128,0.1)",
@@ -1568,12 +1688,9 @@ function EquityCurveChart({
 
     // P25-P75 filled area (light blue)
     traces.push({
-      x: [...percentiles.steps, ...percentiles.steps.slice().reverse()],
-      y: [
-        ...toPortfolioValue(percentiles.p25),
-        ...toPortfolioValue(percentiles.p75).reverse(),
-      ],
-      type: "scatter",
+      x: bands.bandX,
+      y: bands.p25To75,
+      type: "scattergl",
       mode: "none",
       fill: "toself",
       fillcolor: isDark ? "rgba(59, 130, 246, 0.2)" : "rgba(59, 130, 246, 0.2)",
@@ -1585,9 +1702,9 @@ function EquityCurveChart({
 
     // Median line
     traces.push({
-      x: percentiles.steps,
-      y: toPortfolioValue(percentiles.p50),
-      type: "scatter",
+      x: bands.steps,
+      y: bands.median,
+      type: "scattergl",
       mode: "lines",
       name: "Median (50th)",
       line: { color: "#3b82f6", width: 2.5 },
@@ -1595,10 +1712,10 @@ function EquityCurveChart({
         "<b>Median</b><br>Trade: %{x}<br>Value: $%{y:,.0f}<extra></extra>",
     });
 
-    // Initial capital line
+    // Initial capital line; a flat reference only needs its two endpoints
     traces.push({
-      x: percentiles.steps,
-      y: new Array(percentiles.steps.length).fill(initialCapital),
+      x: bands.capitalX,
+      y: [initialCapital, initialCapital],
       type: "scatter",
       mode: "lines",
       line: { color: "#ef4444", dash: "dash", width: 1.5 },
@@ -1606,31 +1723,39 @@ function EquityCurveChart({
       hoverinfo: "skip",
     });
 
+    return traces;
+  }, [bands, paths, initialCapital, isDark]);
+
+  // Layout is memoized separately so toggling the axis scale doesn't rebuild
+  // (or make Plotly re-diff) the trace arrays
+  const layout = useMemo(() => {
+    // Shared chart palettes, built once in the chart wrapper module
+    const palette = isDark ? DARK_CHART_THEME : LIGHT_CHART_THEME;
+
     const plotLayout = {
-      paper_bgcolor: isDark ? "#020817" : "#ffffff",
-      plot_bgcolor: isDark ? "#020817" : "#ffffff",
+      paper_bgcolor: palette.background,
+      plot_bgcolor: palette.background,
       font: {
-        family:
-          '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif',
+        family: CHART_FONT_FAMILY,
         size: 12,
-        color: isDark ? "#f8fafc" : "#0f172a",
+        color: palette.fontColor,
       },
       xaxis: {
         title: { text: "Number of Trades" },
         showgrid: true,
-        gridcolor: isDark ? "#334155" : "#e2e8f0",
-        linecolor: isDark ? "#475569" : "#cbd5e1",
-        tickcolor: isDark ? "#475569" : "#cbd5e1",
-        zerolinecolor: isDark ? "#475569" : "#cbd5e1",
+        gridcolor: palette.gridColor,
+        linecolor: palette.lineColor,
+        tickcolor: palette.lineColor,
+        zerolinecolor: palette.lineColor,
         automargin: true,
       },
       yaxis: {
         title: { text: "Portfolio Value ($)", standoff: 40 },
         showgrid: true,
-        gridcolor: isDark ? "#334155" : "#e2e8f0",
-        linecolor: isDark ? "#475569" : "#cbd5e1",
-        tickcolor: isDark ? "#475569" : "#cbd5e1",
-        zerolinecolor: isDark ? "#475569" : "#cbd5e1",
+        gridcolor: palette.gridColor,
+        linecolor: palette.lineColor,
+        tickcolor: palette.lineColor,
+        zerolinecolor: palette.lineColor,
         type: scaleType,
         automargin: true,
       },
@@ -1643,7 +1768,7 @@ function EquityCurveChart({
         xanchor: "right" as const,
         x: 1,
         font: {
-          color: isDark ? "#f8fafc" : "#0f172a",
+          color: palette.fontColor,
         },
       },
       autosize: true,
@@ -1656,16 +1781,16 @@ function EquityCurveChart({
       },
     };
 
-    return { data: traces, layout: plotLayout };
-  }, [result, initialCapital, scaleType, showIndividualPaths, isDark]);
+    return plotLayout;
+  }, [scaleType, isDark]);
 
   return (
     <div className="w-full">
       <Plot
         data={data}
         layout={layout}
-        config={{ displayModeBar: true, displaylogo: false, responsive: true }}
-        style={{ width: "100%", height: "600px" }}
+        config={EQUITY_CHART_CONFIG}
+        style={EQUITY_CHART_STYLE}
         useResizeHandler
       />
     </div>
@@ -5,6 +5,7 @@ import {
   enrichTrades,
   calculateStrategyMetrics,
   breakdownByExitReason,
+  groupTradesByStrategy,
   parseTradesFromCSV,
 } from '@/lib/processing/tp_optimizer_mae_mfe_service';
 
@@ -72,28 +73,34 @@ export async function GET() {
     // Enrich trades with MAE/MFE calculations if not already enriched
     const enrichedTrades = enrichTrades(seedData.trades);
 
+    // Group trades by strategy once; metrics and breakdowns share the groups
+    const tradesByStrategy = groupTradesByStrategy(enrichedTrades);
+
     // Calculate strategy metrics
-    const strategyMetricsMap = calculateStrategyMetrics(enrichedTrades);
+    const strategyMetricsMap = calculateStrategyMetrics(
+      enrichedTrades,
+      tradesByStrategy
+    );
     const strategyMetrics = Array.from(strategyMetricsMap.values());
 
     // Get exit reason breakdowns for each strategy
     const exitReasonBreakdowns: Record<string, ExitReasonData[]> = {};
-    for (const [strategyName] of strategyMetricsMap) {
-      const strategyTrades = enrichedTrades.filter(
-        (t) => t.strategy === strategyName
-      );
+    for (const [strategyName, strategyTrades] of tradesByStrategy) {
       exitReasonBreakdowns[strategyName] = breakdownByExitReason(
         strategyTrades
       );
     }
 
-    // Calculate global metrics
+    // Calculate global metrics (count winners without building a filtered copy)
+    const winningTrades = enrichedTrades.reduce(
+      (count, t) => count + (t.actual_pct > 0 ? 1 : 0),
+      0
+    );
     const globalMetrics = {
       total_trades: enrichedTrades.length,
       total_strategies: strategyMetrics.length,
       overall_win_rate: Math.round(
-        (enrichedTrades.filter((t) => t.actual_pct > 0).length /
-          enrichedTrades.length) *
+        (winningTrades / enrichedTrades.length) *
           100
       ),
       overall_avg_efficiency: Math.round(
@@ -162,28 +169,34 @@ export async function POST(request: NextRequest) {
     // Enrich trades with MAE/MFE calculations
     const enrichedTrades = enrichTrades(trades);
 
+    // Group trades by strategy once; metrics and breakdowns share the groups
+    const tradesByStrategy = groupTradesByStrategy(enrichedTrades);
+
     // Calculate strategy metrics
-    const strategyMetricsMap = calculateStrategyMetrics(enrichedTrades);
+    const strategyMetricsMap = calculateStrategyMetrics(
+      enrichedTrades,
+      tradesByStrategy
+    );
     const strategyMetrics = Array.from(strategyMetricsMap.values());
 
     // Get exit reason breakdowns for each strategy
     const exitReasonBreakdowns: Record<string, ExitReasonData[]> = {};
-    for (const [strategyName] of strategyMetricsMap) {
-      const strategyTrades = enrichedTrades.filter(
-        (t) => t.strategy === strategyName
-      );
+    for (const [strategyName, strategyTrades] of tradesByStrategy) {
       exitReasonBreakdowns[strategyName] = breakdownByExitReason(
         strategyTrades
       );
     }
 
-    // Calculate global metrics
+    // Calculate global metrics (count winners without building a filtered copy)
+    const winningTrades = enrichedTrades.reduce(
+      (count, t) => count + (t.actual_pct > 0 ? 1 : 0),
+      0
+    );
     const globalMetrics = {
       total_trades: enrichedTrades.length,
       total_strategies: strategyMetrics.length,
       overall_win_rate: Math.round(
-        (enrichedTrades.filter((t) => t.actual_pct > 0).length /
-          enrichedTrades.length) *
+        (winningTrades / enrichedTrades.length) *
           100
       ),
       overall_avg_efficiency: Math.round(
@@ -13,6 +13,7 @@ import {
   type TooltipProps,
 } from 'recharts';
 import { ExitReasonMetrics } from '@/lib/processing/exit_reason_analyzer';
+import { selectTop } from '@/lib/utils';
 
 interface ExitReasonContributionChartProps {
   data: ExitReasonMetrics[];
@@ -22,9 +23,11 @@ export function ExitReasonContributionChart({
   data,
 }: ExitReasonContributionChartProps) {
   // Sort by missed profit for better visualization
-  const chartData = [...data]
-    .sort((a, b) => b.missed_profit_pct - a.missed_profit_pct)
-    .slice(0, 10); // Top 10
+  const chartData = selectTop(
+    data,
+    10,
+    (a, b) => b.missed_profit_pct - a.missed_profit_pct
+  ); // Top 10
 
   const getEfficiencyColor = (efficiency: number) => {
     if (efficiency >= 80) return '#22c55e'; // Green
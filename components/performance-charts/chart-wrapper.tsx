@@ -51,6 +51,44 @@ interface ChartWrapperProps {
   style?: React.CSSProperties;
 }
 
+export const CHART_FONT_FAMILY =
+  '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif';
+
+// Theme palettes are static, so build them once instead of on every layout memo
+export const DARK_CHART_THEME = {
+  background: "#020817",
+  fontColor: "#f8fafc",
+  gridColor: "#334155",
+  lineColor: "#475569",
+  colorway: [
+    "#3b82f6",
+    "#10b981",
+    "#f59e0b",
+    "#ef4444",
+    "#8b5cf6",
+    "#06b6d4",
+    "#84cc16",
+    "#f97316",
+  ],
+};
+
+export const LIGHT_CHART_THEME = {
+  background: "#ffffff",
+  fontColor: "#0f172a",
+  gridColor: "#e2e8f0",
+  lineColor: "#cbd5e1",
+  colorway: [
+    "#2563eb",
+    "#059669",
+    "#d97706",
+    "#dc2626",
+    "#7c3aed",
+    "#0891b2",
+    "#65a30d",
+    "#ea580c",
+  ],
+};
+
 const ChartSkeleton = () => (
   <div className="space-y-3">
     <div className="space-y-2">
@@ -182,54 +220,33 @@ export function ChartWrapper({
 
   // Enhanced layout with theme support
   const themedLayout = React.useMemo(() => {
-    const isDark = theme === "dark";
+    const palette = theme === "dark" ? DARK_CHART_THEME : LIGHT_CHART_THEME;
 
     return {
       ...layout,
-      paper_bgcolor: isDark ? "#020817" : "#ffffff",
-      plot_bgcolor: isDark ? "#020817" : "#ffffff",
+      paper_bgcolor: palette.background,
+      plot_bgcolor: palette.background,
       font: {
-        family:
-          '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif',
+        family: CHART_FONT_FAMILY,
         size: 12,
-        color: isDark ? "#f8fafc" : "#0f172a",
+        color: palette.fontColor,
         ...layout.font,
       },
-      colorway: isDark
-        ? [
-            "#3b82f6",
-            "#10b981",
-            "#f59e0b",
-            "#ef4444",
-            "#8b5cf6",
-            "#06b6d4",
-            "#84cc16",
-            "#f97316",
-          ]
-        : [
-            "#2563eb",
-            "#059669",
-            "#d97706",
-            "#dc2626",
-            "#7c3aed",
-            "#0891b2",
-            "#65a30d",
-            "#ea580c",
-          ],
+      colorway: palette.colorway,
       xaxis: {
-        gridcolor: isDark ? "#334155" : "#e2e8f0",
-        linecolor: isDark ? "#475569" : "#cbd5e1",
-        tickcolor: isDark ? "#475569" : "#cbd5e1",
-        zerolinecolor: isDark ? "#475569" : "#cbd5e1",
+        gridcolor: palette.gridColor,
+        linecolor: palette.lineColor,
+        tickcolor: palette.lineColor,
+        zerolinecolor: palette.lineColor,
         ...layout.xaxis,
         // Ensure automargin is applied after layout.xaxis spread
         automargin: true,
       },
       yaxis: {
-        gridcolor: isDark ? "#334155" : "#e2e8f0",
-        linecolor: isDark ? "#475569" : "#cbd5e1",
-        tickcolor: isDark ? "#475569" : "#cbd5e1",
-        zerolinecolor: isDark ? "#475569" : "#cbd5e1",
+        gridcolor: palette.gridColor,
+        linecolor: palette.lineColor,
+        tickcolor: palette.lineColor,
+        zerolinecolor: palette.lineColor,
         title: {
           standoff: 40,
           ...layout.yaxis?.title,
@@ -29,6 +29,50 @@ const VIX_BUCKETS = [
   { name: '≥ 25', min: 25, max: Infinity }
 ]
 
+// Subplot titles and the divider don't depend on the data, so build them once
+const SUBPLOT_TITLE_STYLE = {
+  xref: 'paper',
+  yref: 'paper',
+  x: 0.5,
+  xanchor: 'center',
+  showarrow: false,
+  font: {
+    size: 13,
+    color: '#0f172a'
+  }
+} as const
+
+const TITLE_ANNOTATIONS: Layout['annotations'] = [
+  {
+    ...SUBPLOT_TITLE_STYLE,
+    text: '<b>Opening VIX vs. Profit/Loss</b>',
+    y: 1.0,
+    yanchor: 'bottom'
+  },
+  {
+    ...SUBPLOT_TITLE_STYLE,
+    text: '<b>Closing VIX vs. Profit/Loss</b>',
+    y: 0.44,
+    yanchor: 'middle'
+  }
+]
+
+// Horizontal divider line between the two charts
+const DIVIDER_SHAPES: Layout['shapes'] = [{
+  type: 'line',
+  xref: 'paper',
+  yref: 'paper',
+  x0: 0.05,
+  x1: 0.95,
+  y0: 0.48,
+  y1: 0.48,
+  line: {
+    color: '#e2e8f0',
+    width: 1,
+    dash: 'dot'
+  }
+}]
+
 export function VixRegimeChart({ className }: VixRegimeChartProps) {
   const { data } = usePerformanceStore()
 
@@ -189,54 +233,6 @@ export function VixRegimeChart({ className }: VixRegimeChartProps) {
       ]
     }
 
-    // Create title annotations for each subplot
-    const titleAnnotations: Layout['annotations'] = [
-      {
-        text: '<b>Opening VIX vs. Profit/Loss</b>',
-        xref: 'paper',
-        yref: 'paper',
-        x: 0.5,
-        y: 1.0,
-        xanchor: 'center',
-        yanchor: 'bottom',
-        showarrow: false,
-        font: {
-          size: 13,
-          color: '#0f172a'
-        }
-      },
-      {
-        text: '<b>Closing VIX vs. Profit/Loss</b>',
-        xref: 'paper',
-        yref: 'paper',
-        x: 0.5,
-        y: 0.44,
-        xanchor: 'center',
-        yanchor: 'middle',
-        showarrow: false,
-        font: {
-          size: 13,
-          color: '#0f172a'
-        }
-      }
-    ]
-
-    // Add a horizontal divider line between the two charts
-    const dividerShape: Layout['shapes'] = [{
-      type: 'line',
-      xref: 'paper',
-      yref: 'paper',
-      x0: 0.05,
-      x1: 0.95,
-      y0: 0.48,
-      y1: 0.48,
-      line: {
-        color: '#e2e8f0',
-        width: 1,
-        dash: 'dot'
-      }
-    }]
-
     const chartLayout: Partial<Layout> = {
       grid: {
         rows: 2,
@@ -276,8 +272,8 @@ export function VixRegimeChart({ className }: VixRegimeChartProps) {
       },
       showlegend: false,
       hovermode: 'closest',
-      shapes: [...regimeShapes(true), ...regimeShapes(false), ...dividerShape],
-      annotations: titleAnnotations,
+      shapes: [...regimeShapes(true), ...regimeShapes(false), ...DIVIDER_SHAPES],
+      annotations: TITLE_ANNOTATIONS,
       margin: {
         t: 20,
         r: 120,
@@ -2,10 +2,126 @@
 
 import { useMemo } from "react";
 import { ChartWrapper } from "@/components/performance-charts/chart-wrapper";
-import type { MonteCarloResult } from "@/lib/calculations/monte-carlo";
+import {
+  getSortedMaxDrawdowns,
+  getSortedTotalReturns,
+  type MonteCarloResult,
+} from "@/lib/calculations/monte-carlo";
 import type { Data } from "plotly.js";
 import { useTheme } from "next-themes";
 
+// Static Plotly props, shared so ChartWrapper's memoized config/style stay stable
+const DISTRIBUTION_CHART_CONFIG = { displayModeBar: false, responsive: true };
+const DISTRIBUTION_CHART_STYLE = { width: "100%", height: "400px" };
+
+// Layouts only vary by theme, so each chart memoizes one per theme instead of
+// rebuilding it on every result change. They are not shared module constants
+// because Plotly writes axis ranges back into the layout objects it is given.
+function buildDistributionLayout(xTitle: string, isDark: boolean) {
+  const gridcolor = isDark ? "rgba(255,255,255,0.1)" : "rgba(0,0,0,0.1)";
+  return {
+    xaxis: {
+      title: { text: xTitle },
+      showgrid: true,
+      gridcolor,
+    },
+    yaxis: {
+      title: { text: "Frequency" },
+      showgrid: true,
+      gridcolor,
+    },
+    showlegend: true,
+    legend: {
+      orientation: "h" as const,
+      yanchor: "bottom" as const,
+      y: 1.02,
+      xanchor: "right" as const,
+      x: 1,
+    },
+    autosize: true,
+    height: 400,
+  };
+}
+
+interface HistogramBins {
+  centers: number[];
+  counts: number[];
+  binWidth: number;
+  maxCount: number;
+}
+
+// Bin already-sorted values into equal-width buckets so the chart only ships
+// bin counts to Plotly instead of every simulation value
+function binSortedValues(
+  sortedValues: ArrayLike<number>,
+  binCount: number
+): HistogramBins {
+  const total = sortedValues.length;
+  if (total === 0) {
+    return { centers: [], counts: [], binWidth: 1, maxCount: 0 };
+  }
+
+  const min = sortedValues[0];
+  const max = sortedValues[total - 1];
+  if (max === min) {
+    return { centers: [min], counts: [total], binWidth: 1, maxCount: total };
+  }
+
+  const binWidth = (max - min) / binCount;
+  const centers: number[] = new Array(binCount);
+  const counts: number[] = new Array(binCount).fill(0);
+  for (let bin = 0; bin < binCount; bin++) {
+    centers[bin] = min + (bin + 0.5) * binWidth;
+  }
+
+  // Values are sorted, so the bin index only ever moves forward
+  let bin = 0;
+  let upperEdge = min + binWidth;
+  for (let i = 0; i < total; i++) {
+    while (sortedValues[i] >= upperEdge && bin < binCount - 1) {
+      bin++;
+      upperEdge = min + (bin + 1) * binWidth;
+    }
+    counts[bin]++;
+  }
+
+  let maxCount = 0;
+  for (const count of counts) {
+    if (count > maxCount) {
+      maxCount = count;
+    }
+  }
+
+  return { centers, counts, binWidth, maxCount };
+}
+
+// Percentile markers drawn on both distribution charts
+const PERCENTILE_MARKERS = [
+  { label: "P5", fraction: 0.05, color: "#ef4444" },
+  { label: "P50", fraction: 0.5, color: "#3b82f6" },
+  { label: "P95", fraction: 0.95, color: "#22c55e" },
+] as const;
+
+// Vertical dashed lines at each marker percentile of the sorted values
+function buildPercentileLines(
+  sortedValues: ArrayLike<number>,
+  yMax: number
+): Data[] {
+  return PERCENTILE_MARKERS.map(({ label, fraction, color }) => {
+    const value = sortedValues[Math.floor(sortedValues.length * fraction)];
+    return {
+      x: [value, value],
+      y: [0, yMax],
+      type: "scatter",
+      mode: "lines",
+      line: { color, dash: "dash", width: 2 },
+      name: `${label}: ${value.toFixed(1)}%`,
+      showlegend: true,
+      hoverinfo: "skip",
+    } as Data;
+  });
+}
+
 interface ReturnDistributionChartProps {
   result: MonteCarloResult;
 }
@@ -14,25 +130,30 @@ export function ReturnDistributionChart({ result }: ReturnDistributionChartProps
   const { theme } = useTheme();
   const isDark = theme === "dark";
 
-  const { data, layout } = useMemo(() => {
-    const { simulations } = result;
+  // Binning and percentile markers depend only on the result, so a theme
+  // change just restyles the bars below
+  const histogram = useMemo(() => {
+    // Final returns sorted once per result (shared with the simulation
+    // statistics), scaled to percentages for percentiles and binning
+    const sortedReturns = getSortedTotalReturns(result).map((r) => r * 100);
+    const bins = binSortedValues(sortedReturns, 50);
 
-    // Get final returns from all simulations
-    const finalReturns = simulations.map((sim) => sim.totalReturn * 100);
+    // Percentile lines span the tallest bin
+    const yMax = Math.max(1, bins.maxCount);
 
-    // Calculate percentiles manually
-    const sortedReturns = [...finalReturns].sort((a, b) => a - b);
-    const p5 = sortedReturns[Math.floor(sortedReturns.length * 0.05)];
-    const p50 = sortedReturns[Math.floor(sortedReturns.length * 0.50)];
-    const p95 = sortedReturns[Math.floor(sortedReturns.length * 0.95)];
+    return { bins, percentileLines: buildPercentileLines(sortedReturns, yMax) };
+  }, [result]);
 
-    const traces: Data[] = [];
+  const data = useMemo(() => {
+    const { bins, percentileLines } = histogram;
 
     // Histogram
+    const traces: Data[] = [];
     traces.push({
-      x: finalReturns,
-      type: "histogram",
-      nbinsx: 50,
+      x: bins.centers,
+      y: bins.counts,
+      width: bins.binWidth,
+      type: "bar",
       marker: {
         color: isDark ? "rgba(59, 130, 246, 0.7)" : "rgba(37, 99, 235, 0.7)",
         line: {
@@ -44,68 +165,16 @@ export function ReturnDistributionChart({ result }: ReturnDistributionChartProps
       hovertemplate: "<b>Return:</b> %{x:.1f}%<br><b>Count:</b> %{y}<extra></extra>",
     } as Data);
 
-    // Get histogram max for vertical line height
-    const yMax = 120;
-
     // Add percentile lines
-    traces.push(
-      {
-        x: [p5, p5],
-        y: [0, yMax],
-        type: "scatter",
-        mode: "lines",
-        line: { color: "#ef4444", dash: "dash", width: 2 },
-        name: `P5: ${p5.toFixed(1)}%`,
-        showlegend: true,
-        hoverinfo: "skip",
-      } as Data,
-      {
-        x: [p50, p50],
-        y: [0, yMax],
-        type: "scatter",
-        mode: "lines",
-        line: { color: "#3b82f6", dash: "dash", width: 2 },
-        name: `P50: ${p50.toFixed(1)}%`,
-        showlegend: true,
-        hoverinfo: "skip",
-      } as Data,
-      {
-        x: [p95, p95],
-        y: [0, yMax],
-        type: "scatter",
-        mode: "lines",
-        line: { color: "#22c55e", dash: "dash", width: 2 },
-        name: `P95: ${p95.toFixed(1)}%`,
-        showlegend: true,
-        hoverinfo: "skip",
-      } as Data
-    );
-
-    const plotLayout = {
-      xaxis: {
-        title: { text: "Cumulative Return" },
-        showgrid: true,
-        gridcolor: isDark ? "rgba(255,255,255,0.1)" : "rgba(0,0,0,0.1)",
-      },
-      yaxis: {
-        title: { text: "Frequency" },
-        showgrid: true,
-        gridcolor: isDark ? "rgba(255,255,255,0.1)" : "rgba(0,0,0,0.1)",
-      },
-      showlegend: true,
-      legend: {
-        orientation: "h" as const,
-        yanchor: "bottom" as const,
-        y: 1.02,
-        xanchor: "right" as const,
-        x: 1,
-      },
-      autosize: true,
-      height: 400,
-    };
+    traces.push(...percentileLines);
+
+    return traces;
+  }, [histogram, isDark]);
 
-    return { data: traces, layout: plotLayout };
-  }, [result, isDark]);
+  const layout = useMemo(
+    () => buildDistributionLayout("Cumulative Return", isDark),
+    [isDark]
+  );
 
   return (
     <ChartWrapper
@@ -118,8 +187,8 @@ export function ReturnDistributionChart({ result }: ReturnDistributionChartProps
       }}
       data={data}
       layout={layout}
-      config={{ displayModeBar: false, responsive: true }}
-      style={{ width: "100%", height: "400px" }}
+      config={DISTRIBUTION_CHART_CONFIG}
+      style={DISTRIBUTION_CHART_STYLE}
     />
   );
 }
@@ -132,25 +201,29 @@ export function DrawdownDistributionChart({ result }: DrawdownDistributionChartP
   const { theme } = useTheme();
   const isDark = theme === "dark";
 
-  const { data, layout } = useMemo(() => {
-    const { simulations } = result;
+  // Binning and percentile markers depend only on the result, so a theme
+  // change just restyles the bars below
+  const histogram = useMemo(() => {
+    // Sorted drawdowns are cached per result and shared with the statistics cards
+    const maxDrawdowns = getSortedMaxDrawdowns(result).map((dd) => dd * 100);
+    const bins = binSortedValues(maxDrawdowns, 30);
 
-    // Get max drawdowns from all simulations (as percentages)
-    const maxDrawdowns = simulations.map((sim) => sim.maxDrawdown * 100);
+    // Percentile lines span the tallest bin
+    const yMax = Math.max(1, bins.maxCount);
 
-    // Calculate percentiles
-    const sortedDrawdowns = [...maxDrawdowns].sort((a, b) => a - b);
-    const p5 = sortedDrawdowns[Math.floor(sortedDrawdowns.length * 0.05)];
-    const p50 = sortedDrawdowns[Math.floor(sortedDrawdowns.length * 0.50)];
-    const p95 = sortedDrawdowns[Math.floor(sortedDrawdowns.length * 0.95)];
+    return { bins, percentileLines: buildPercentileLines(maxDrawdowns, yMax) };
+  }, [result]);
 
-    const traces: Data[] = [];
+  const data = useMemo(() => {
+    const { bins, percentileLines } = histogram;
 
     // Histogram
+    const traces: Data[] = [];
     traces.push({
-      x: maxDrawdowns,
-      type: "histogram",
-      nbinsx: 30,
+      x: bins.centers,
+      y: bins.counts,
+      width: bins.binWidth,
+      type: "bar",
       marker: {
         color: isDark ? "rgba(249, 115, 22, 0.7)" : "rgba(234, 88, 12, 0.7)",
         line: {
@@ -162,68 +235,16 @@ export function DrawdownDistributionChart({ result }: DrawdownDistributionChartP
       hovertemplate: "<b>Drawdown:</b> %{x:.1f}%<br><b>Count:</b> %{y}<extra></extra>",
     } as Data);
 
-    // Get histogram max for vertical line height
-    const yMax = 200;
-
     // Add percentile lines
-    traces.push(
-      {
-        x: [p5, p5],
-        y: [0, yMax],
-        type: "scatter",
-        mode: "lines",
-        line: { color: "#ef4444", dash: "dash", width: 2 },
-        name: `P5: ${p5.toFixed(1)}%`,
-        showlegend: true,
-        hoverinfo: "skip",
-      } as Data,
-      {
-        x: [p50, p50],
-        y: [0, yMax],
-        type: "scatter",
-        mode: "lines",
-        line: { color: "#3b82f6", dash: "dash", width: 2 },
-        name: `P50: ${p50.toFixed(1)}%`,
-        showlegend: true,
-        hoverinfo: "skip",
-      } as Data,
-      {
-        x: [p95, p95],
-        y: [0, yMax],
-        type: "scatter",
-        mode: "lines",
-        line: { color: "#22c55e", dash: "dash", width: 2 },
-        name: `P95: ${p95.toFixed(1)}%`,
-        showlegend: true,
-        hoverinfo: "skip",
-      } as Data
-    );
-
-    const plotLayout = {
-      xaxis: {
-        title: { text: "Drawdown (%)" },
-        showgrid: true,
-        gridcolor: isDark ? "rgba(255,255,255,0.1)" : "rgba(0,0,0,0.1)",
-      },
-      yaxis: {
-        title: { text: "Frequency" },
-        showgrid: true,
-        gridcolor: isDark ? "rgba(255,255,255,0.1)" : "rgba(0,0,0,0.1)",
-      },
-      showlegend: true,
-      legend: {
-        orientation: "h" as const,
-        yanchor: "bottom" as const,
-        y: 1.02,
-        xanchor: "right" as const,
-        x: 1,
-      },
-      autosize: true,
-      height: 400,
-    };
+    traces.push(...percentileLines);
 
-    return { data: traces, layout: plotLayout };
-  }, [result, isDark]);
+    return traces;
+  }, [histogram, isDark]);
+
+  const layout = useMemo(
+    () => buildDistributionLayout("Drawdown (%)", isDark),
+    [isDark]
+  );
 
   return (
     <ChartWrapper
@@ -236,8 +257,8 @@ export function DrawdownDistributionChart({ result }: DrawdownDistributionChartP
       }}
       data={data}
       layout={layout}
-      config={{ displayModeBar: false, responsive: true }}
-      style={{ width: "100%", height: "400px" }}
+      config={DISTRIBUTION_CHART_CONFIG}
+      style={DISTRIBUTION_CHART_STYLE}
     />
   );
 }
@@ -6,7 +6,10 @@ import {
   HoverCardContent,
   HoverCardTrigger,
 } from "@/components/ui/hover-card";
-import type { MonteCarloResult } from "@/lib/calculations/monte-carlo";
+import {
+  getSortedMaxDrawdowns,
+  type MonteCarloResult,
+} from "@/lib/calculations/monte-carlo";
 import {
   AlertOctagon,
   HelpCircle,
@@ -38,8 +41,7 @@ export function StatisticsCards({ result }: StatisticsCardsProps) {
       : statistics.medianTotalReturn;
 
   // Calculate drawdown percentiles
-  const maxDrawdowns = result.simulations.map((sim) => sim.maxDrawdown);
-  const sortedDrawdowns = [...maxDrawdowns].sort((a, b) => a - b);
+  const sortedDrawdowns = getSortedMaxDrawdowns(result);
   const drawdownP5 = sortedDrawdowns[Math.floor(sortedDrawdowns.length * 0.05)];
   const drawdownP50 = sortedDrawdowns[Math.floor(sortedDrawdowns.length * 0.50)];
   const drawdownP95 = sortedDrawdowns[Math.floor(sortedDrawdowns.length * 0.95)];
@@ -9,6 +9,7 @@ import { Progress } from "@/components/ui/progress";
 import { Alert, AlertDescription } from "@/components/ui/alert";
 import { Badge } from "@/components/ui/badge";
 import { useTPOptimizerStore } from "@/lib/stores/tp-optimizer-store";
+import { selectTop } from "@/lib/utils";
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from "recharts";
 
 interface TPOptimizePanelProps {
@@ -355,10 +356,7 @@ export function TPOptimizePanel({ onOptimizationComplete }: TPOptimizePanelProps
                     </div>
                     <div>
                       <strong>Top 5 TP Levels:</strong>
-                      {results
-                        .slice()
-                        .sort((a, b) => b.totalPnL - a.totalPnL)
-                        .slice(0, 5)
+                      {selectTop(results, 5, (a, b) => b.totalPnL - a.totalPnL)
                         .map((result, i) => (
                           <div key={i} className="ml-2">
                             #{i + 1}: {formatTPPercentage(result.tpPct)} → {formatValue(result.totalPnL)}
@@ -6,6 +6,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { Badge } from "@/components/ui/badge";
 import { Alert, AlertDescription } from "@/components/ui/alert";
 import { useTPOptimizerStore } from "@/lib/stores/tp-optimizer-store";
+import { selectTop } from "@/lib/utils";
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from "recharts";
 
 export function TPSummary() {
@@ -28,14 +29,14 @@ export function TPSummary() {
     }));
 
     // Top 5 results
-    const sortedResults = [...results].sort((a, b) => {
+    const sortedResults = selectTop(results, 5, (a, b) => {
       switch (objective) {
         case "totalPnL": return b.totalPnL - a.totalPnL;
         case "expectancy": return b.expectancy - a.expectancy;
         case "profitFactor": return b.profitFactor - a.profitFactor;
         default: return 0;
       }
-    }).slice(0, 5);
+    });
 
     return {
       improvement,
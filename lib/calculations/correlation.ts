@@ -46,8 +46,8 @@ export function calculateCorrelationMatrix(
   } = options;
 
   // Group trades by strategy and date
-  const strategyDailyReturns: Record<string, Record<string, number>> = {};
-  const allDates = new Set<string>();
+  const strategyDailyReturns = new Map<string, Map<number, number>>();
+  const allDates = new Set<number>();
 
   for (const trade of trades) {
     // Skip trades without a strategy
@@ -67,17 +67,21 @@ export function calculateCorrelationMatrix(
       continue;
     }
 
-    if (!strategyDailyReturns[strategy]) {
-      strategyDailyReturns[strategy] = {};
+    let dailyReturns = strategyDailyReturns.get(strategy);
+    if (!dailyReturns) {
+      dailyReturns = new Map();
+      strategyDailyReturns.set(strategy, dailyReturns);
     }
 
-    strategyDailyReturns[strategy][dateKey] =
-      (strategyDailyReturns[strategy][dateKey] || 0) + normalizedReturn;
+    dailyReturns.set(
+      dateKey,
+      (dailyReturns.get(dateKey) || 0) + normalizedReturn
+    );
 
     allDates.add(dateKey);
   }
 
-  const strategies = Object.keys(strategyDailyReturns).sort();
+  const strategies = Array.from(strategyDailyReturns.keys()).sort();
 
   // Need at least 2 strategies
   if (strategies.length < 2) {
@@ -87,56 +91,93 @@ export function calculateCorrelationMatrix(
     return { strategies, correlationData: identityMatrix };
   }
 
-  const correlationData: number[][] = [];
+  // From here on strategies are addressed by their index in the sorted list,
+  // so the pairwise loop does array reads instead of hashing names
+  const dailyReturnsByStrategy = strategies.map(
+    (strategy) => strategyDailyReturns.get(strategy)!
+  );
 
   const sortedDates = alignment === "zero-pad"
-    ? Array.from(allDates).sort()
+    ? Array.from(allDates).sort((a, b) => a - b)
     : [];
 
-  const zeroPaddedReturns: Record<string, number[]> = {};
+  // Zero-filled series are preallocated and only the days a strategy traded
+  // are written, instead of probing every strategy for every date
+  const zeroPaddedReturns: Float64Array[] = [];
   if (alignment === "zero-pad") {
-    for (const strategy of strategies) {
-      zeroPaddedReturns[strategy] = sortedDates.map(
-        (date) => strategyDailyReturns[strategy][date] || 0
-      );
+    const dateIndex = new Map<number, number>();
+    sortedDates.forEach((date, index) => dateIndex.set(date, index));
+
+    for (const dailyReturns of dailyReturnsByStrategy) {
+      const series = new Float64Array(sortedDates.length);
+      for (const [date, value] of dailyReturns) {
+        series[dateIndex.get(date)!] = value || 0;
+      }
+      zeroPaddedReturns.push(series);
     }
   }
 
-  for (const strategy1 of strategies) {
-    const row: number[] = [];
+  // With zero-fill every pair shares the same dates, so for Pearson each
+  // series can be mean-centred once and every pair reduces to a dot product.
+  // Spearman is Pearson on ranks, and the ranks of a full series don't depend
+  // on the pair either, so they are computed once per strategy as well.
+  const useCenteredSeries =
+    alignment === "zero-pad" && (method === "pearson" || method === "spearman");
+  const centeredReturns: CenteredSeries[] = useCenteredSeries
+    ? zeroPaddedReturns.map((series) =>
+        centerSeries(method === "spearman" ? getRanks(series) : series)
+      )
+    : [];
 
-    for (const strategy2 of strategies) {
-      if (strategy1 === strategy2) {
-        row.push(1.0);
-        continue;
-      }
+  // Correlation is symmetric, so only the upper triangle is computed and
+  // each value is mirrored into the lower triangle
+  const correlationData: number[][] = strategies.map((_, i) =>
+    strategies.map((_, j) => (i === j ? 1.0 : 0.0))
+  );
 
-      let returns1: number[] = [];
-      let returns2: number[] = [];
+  for (let i = 0; i < strategies.length; i++) {
+    for (let j = i + 1; j < strategies.length; j++) {
+      let returns1: ArrayLike<number>;
+      let returns2: ArrayLike<number>;
 
       if (alignment === "zero-pad") {
-        returns1 = zeroPaddedReturns[strategy1];
-        returns2 = zeroPaddedReturns[strategy2];
+        returns1 = zeroPaddedReturns[i];
+        returns2 = zeroPaddedReturns[j];
       } else {
-        const strategy1Data = strategyDailyReturns[strategy1];
-        const strategy2Data = strategyDailyReturns[strategy2];
-
-        for (const date of Object.keys(strategy1Data)) {
-          if (date in strategy2Data) {
-            returns1.push(strategy1Data[date]);
-            returns2.push(strategy2Data[date]);
+        const strategy1Data = dailyReturnsByStrategy[i];
+        const strategy2Data = dailyReturnsByStrategy[j];
+
+        // Shared days can't exceed the smaller series, so size the buffers
+        // for that up front and walk the smaller map
+        const swap = strategy2Data.size < strategy1Data.size;
+        const outer = swap ? strategy2Data : strategy1Data;
+        const inner = swap ? strategy1Data : strategy2Data;
+        const sharedOuter = new Float64Array(outer.size);
+        const sharedInner = new Float64Array(outer.size);
+        let sharedCount = 0;
+
+        for (const [date, value] of outer) {
+          const other = inner.get(date);
+          if (other !== undefined) {
+            sharedOuter[sharedCount] = value;
+            sharedInner[sharedCount] = other;
+            sharedCount++;
           }
         }
+
+        returns1 = (swap ? sharedInner : sharedOuter).subarray(0, sharedCount);
+        returns2 = (swap ? sharedOuter : sharedInner).subarray(0, sharedCount);
       }
 
-      // Need at least 2 data points for correlation
+      // Need at least 2 data points for correlation (cell stays at 0)
       if (returns1.length < 2 || returns2.length < 2) {
-        row.push(0.0);
         continue;
       }
 
       let correlation: number;
-      if (method === "pearson") {
+      if (useCenteredSeries) {
+        correlation = correlateCentered(centeredReturns[i], centeredReturns[j]);
+      } else if (method === "pearson") {
         correlation = pearsonCorrelation(returns1, returns2);
       } else if (method === "spearman") {
         correlation = spearmanCorrelation(returns1, returns2);
@@ -145,29 +186,39 @@ export function calculateCorrelationMatrix(
         correlation = kendallCorrelation(returns1, returns2);
       }
 
-      row.push(correlation);
+      correlationData[i][j] = correlation;
+      correlationData[j][i] = correlation;
     }
-
-    correlationData.push(row);
   }
 
   return { strategies, correlationData };
 }
 
+/**
+ * math.js only accepts plain arrays; copy typed-array buffers, pass arrays through
+ */
+function toPlainArray(values: ArrayLike<number>): number[] {
+  return Array.isArray(values) ? values : Array.from(values);
+}
+
 /**
  * Calculate Pearson correlation coefficient
  */
-function pearsonCorrelation(x: number[], y: number[]): number {
+function pearsonCorrelation(
+  x: ArrayLike<number>,
+  y: ArrayLike<number>
+): number {
   if (x.length !== y.length || x.length === 0) return 0;
 
-  const meanX = mean(x);
-  const meanY = mean(y);
+  const n = x.length;
+  const meanX = mean(toPlainArray(x)) as number;
+  const meanY = mean(toPlainArray(y)) as number;
 
   let numerator = 0;
   let sumXSquared = 0;
   let sumYSquared = 0;
 
-  for (let i = 0; i < x.length; i++) {
+  for (let i = 0; i < n; i++) {
     const diffX = x[i] - meanX;
     const diffY = y[i] - meanY;
 
@@ -183,10 +234,57 @@ function pearsonCorrelation(x: number[], y: number[]): number {
   return numerator / denominator;
 }
 
+interface CenteredSeries {
+  deviations: Float64Array;
+  sumSquares: number;
+}
+
+/**
+ * Subtract the mean from a series and keep its sum of squared deviations
+ */
+function centerSeries(values: ArrayLike<number>): CenteredSeries {
+  const n = values.length;
+  const seriesMean = mean(toPlainArray(values)) as number;
+
+  const deviations = new Float64Array(n);
+  let sumSquares = 0;
+  for (let i = 0; i < n; i++) {
+    const diff = values[i] - seriesMean;
+    deviations[i] = diff;
+    sumSquares += diff * diff;
+  }
+
+  return { deviations, sumSquares };
+}
+
+/**
+ * Pearson correlation of two pre-centred series of equal length.
+ * Same arithmetic as pearsonCorrelation, without re-centring per pair.
+ */
+function correlateCentered(a: CenteredSeries, b: CenteredSeries): number {
+  const x = a.deviations;
+  const y = b.deviations;
+  if (x.length !== y.length || x.length === 0) return 0;
+
+  let numerator = 0;
+  for (let i = 0; i < x.length; i++) {
+    numerator += x[i] * y[i];
+  }
+
+  const denominator = Math.sqrt(a.sumSquares * b.sumSquares);
+
+  if (denominator === 0) return 0;
+
+  return numerator / denominator;
+}
+
 /**
  * Calculate Spearman rank correlation coefficient
  */
-function spearmanCorrelation(x: number[], y: number[]): number {
+function spearmanCorrelation(
+  x: ArrayLike<number>,
+  y: ArrayLike<number>
+): number {
   if (x.length !== y.length || x.length === 0) return 0;
 
   // Convert values to ranks
@@ -200,7 +298,10 @@ function spearmanCorrelation(x: number[], y: number[]): number {
 /**
  * Calculate Kendall's tau correlation coefficient
  */
-function kendallCorrelation(x: number[], y: number[]): number {
+function kendallCorrelation(
+  x: ArrayLike<number>,
+  y: ArrayLike<number>
+): number {
   if (x.length !== y.length || x.length === 0) return 0;
 
   let concordant = 0;
@@ -230,8 +331,8 @@ function kendallCorrelation(x: number[], y: number[]): number {
 /**
  * Convert array of values to ranks (handling ties with average rank)
  */
-function getRanks(values: number[]): number[] {
-  const indexed = values.map((value, index) => ({ value, index }));
+function getRanks(values: ArrayLike<number>): number[] {
+  const indexed = Array.from(values, (value, index) => ({ value, index }));
   indexed.sort((a, b) => a.value - b.value);
 
   const ranks = new Array(values.length);
@@ -281,19 +382,26 @@ function normalizeReturn(
   }
 }
 
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
+/**
+ * Bucket a trade into its UTC calendar day, as a day number since the epoch.
+ * Same grouping as the ISO date string, without formatting a string per trade.
+ */
 function getTradeDateKey(
   trade: Trade,
   basis: CorrelationDateBasis
-): string {
+): number {
   const date = basis === "closed" ? trade.dateClosed : trade.dateOpened;
+  const time = date ? date.getTime() : NaN;
 
-  if (!date) {
+  if (Number.isNaN(time)) {
     throw new Error(
       "Trade is missing required date information for correlation calculation"
     );
   }
 
-  return date.toISOString().split("T")[0];
+  return Math.floor(time / MS_PER_DAY);
 }
 
 /**
@@ -304,35 +412,45 @@ export function calculateCorrelationAnalytics(
 ): CorrelationAnalytics {
   const { strategies, correlationData } = matrix;
 
-  let strongest = { value: -1, pair: ["", ""] as [string, string] };
-  let weakest = { value: 1, pair: ["", ""] as [string, string] };
+  let strongestValue = -1;
+  let strongestPair: [number, number] | null = null;
+  let weakestValue = 1;
+  let weakestPair: [number, number] | null = null;
   let sumCorrelation = 0;
   let count = 0;
 
   // Find strongest and weakest correlations (excluding diagonal)
   // Strongest = highest correlation (most positive)
   // Weakest = lowest correlation (most negative)
+  // Only the winning indices are tracked; pair labels are resolved once at the end
   for (let i = 0; i < strategies.length; i++) {
+    const row = correlationData[i];
+
     for (let j = i + 1; j < strategies.length; j++) {
-      const value = correlationData[i][j];
+      const value = row[j];
       sumCorrelation += value;
       count++;
 
       // Strongest is the most positive correlation
-      if (value > strongest.value) {
-        strongest = { value, pair: [strategies[i], strategies[j]] };
+      if (value > strongestValue) {
+        strongestValue = value;
+        strongestPair = [i, j];
       }
 
       // Weakest is the most negative correlation (minimum value)
-      if (value < weakest.value) {
-        weakest = { value, pair: [strategies[i], strategies[j]] };
+      if (value < weakestValue) {
+        weakestValue = value;
+        weakestPair = [i, j];
       }
     }
   }
 
+  const toLabels = (pair: [number, number] | null): [string, string] =>
+    pair ? [strategies[pair[0]], strategies[pair[1]]] : ["", ""];
+
   return {
-    strongest,
-    weakest,
+    strongest: { value: strongestValue, pair: toLabels(strongestPair) },
+    weakest: { value: weakestValue, pair: toLabels(weakestPair) },
     averageCorrelation: count > 0 ? sumCorrelation / count : 0,
     strategyCount: strategies.length,
   };
@@ -210,11 +210,11 @@ function resampleWithReplacement<T>(
   seed?: number
 ): T[] {
   const rng = seed !== undefined ? createSeededRandom(seed) : Math.random;
-  const result: T[] = [];
+  const poolSize = data.length;
+  const result: T[] = new Array(sampleSize);
 
   for (let i = 0; i < sampleSize; i++) {
-    const randomIndex = Math.floor(rng() * data.length);
-    result.push(data[randomIndex]);
+    result[i] = data[Math.floor(rng() * poolSize)];
   }
 
   return result;
@@ -228,10 +228,11 @@ function resampleWithReplacement<T>(
  * @returns Function that returns random numbers in [0, 1)
  */
 function createSeededRandom(seed: number): () => number {
-  let state = seed;
+  let state = seed >>> 0;
   return function () {
-    // LCG parameters from Numerical Recipes
-    state = (state * 1664525 + 1013904223) % 4294967296;
+    // LCG parameters from Numerical Recipes, stepped in 32-bit integer math
+    // (Math.imul + >>> 0 is exactly mod 2^32, without float multiply/modulo)
+    state = (Math.imul(state, 1664525) + 1013904223) >>> 0;
     return state / 4294967296;
   };
 }
@@ -709,13 +710,21 @@ function runSingleSimulation(
   tradesPerYear: number,
   isPercentageMode: boolean = false
 ): SimulationPath {
-  // Track capital over time
+  // Track capital over time; both series have one entry per resampled value
+  const numTrades = resampledValues.length;
   let capital = initialCapital;
-  const equityCurve: number[] = [];
-  const returns: number[] = [];
+  const equityCurve: number[] = new Array(numTrades);
+  const returns = new Float64Array(numTrades);
+
+  // Maximum drawdown is tracked while the curve is built. Treat initial
+  // capital (0% return) as the starting peak; peaks never drop below 0, so
+  // the (1 + peak) denominator is always positive.
+  let peak = 0;
+  let maxDrawdown = 0;
 
   // Build equity curve (as cumulative returns from starting capital)
-  for (const value of resampledValues) {
+  for (let i = 0; i < numTrades; i++) {
+    const value = resampledValues[i];
     const capitalBeforeTrade = capital;
 
     if (isPercentageMode) {
@@ -727,13 +736,21 @@ function runSingleSimulation(
     }
 
     const cumulativeReturn = (capital - initialCapital) / initialCapital;
-    equityCurve.push(cumulativeReturn);
+    equityCurve[i] = cumulativeReturn;
 
+    // drawdown = (peakValue - currentValue) / peakValue
+    //          = (peak - cumulativeReturn) / (1 + peak)
+    if (cumulativeReturn > peak) {
+      peak = cumulativeReturn;
+    }
+    const drawdown = (peak - cumulativeReturn) / (1 + peak);
+    if (drawdown > maxDrawdown) {
+      maxDrawdown = drawdown;
+    }
+
+    // Float64Array entries start at 0, which covers a wiped-out account
     if (capitalBeforeTrade > 0) {
-      const periodReturn = capital / capitalBeforeTrade - 1;
-      returns.push(periodReturn);
-    } else {
-      returns.push(0);
+      returns[i] = capital / capitalBeforeTrade - 1;
     }
   }
 
@@ -742,16 +759,12 @@ function runSingleSimulation(
   const totalReturn = (finalValue - initialCapital) / initialCapital;
 
   // Annualized return
-  const numTrades = resampledValues.length;
   const yearsElapsed = numTrades / tradesPerYear;
   const annualizedReturn =
     yearsElapsed > 0
       ? Math.pow(1 + totalReturn, 1 / yearsElapsed) - 1
       : totalReturn;
 
-  // Maximum drawdown
-  const maxDrawdown = calculateMaxDrawdown(equityCurve);
-
   // Sharpe ratio (using individual returns)
   const sharpeRatio = calculateSharpeRatio(returns, tradesPerYear);
 
@@ -765,40 +778,6 @@ function runSingleSimulation(
   };
 }
 
-/**
- * Calculate maximum drawdown from an equity curve
- *
- * @param equityCurve - Array of cumulative returns (as decimals, e.g., 0.5 = 50% gain)
- * @returns Maximum drawdown as a decimal (positive number for losses, e.g., 0.2 = 20% drawdown)
- */
-function calculateMaxDrawdown(equityCurve: number[]): number {
-  let maxDrawdown = 0;
-  let peak = 0; // Treat initial capital (0% return) as the starting peak
-
-  for (const cumulativeReturn of equityCurve) {
-    if (cumulativeReturn > peak) {
-      peak = cumulativeReturn;
-    }
-
-    // Calculate drawdown as percentage decline from peak
-    // Convert cumulative returns to portfolio values for calculation
-    // portfolioValue = initialCapital * (1 + cumulativeReturn)
-    // peakValue = initialCapital * (1 + peak)
-    // drawdown = (peakValue - currentValue) / peakValue
-    //          = (1 + peak - 1 - cumulativeReturn) / (1 + peak)
-    //          = (peak - cumulativeReturn) / (1 + peak)
-
-    if (peak > -1) { // Avoid division by zero if portfolio goes to zero
-      const drawdown = (peak - cumulativeReturn) / (1 + peak);
-      if (drawdown > maxDrawdown) {
-        maxDrawdown = drawdown;
-      }
-    }
-  }
-
-  return maxDrawdown;
-}
-
 /**
  * Calculate Sharpe ratio from returns
  *
@@ -807,21 +786,28 @@ function calculateMaxDrawdown(equityCurve: number[]): number {
  * @returns Sharpe ratio (annualized)
  */
 function calculateSharpeRatio(
-  returns: number[],
+  returns: ArrayLike<number>,
   periodsPerYear: number
 ): number {
-  if (returns.length < 2) {
+  const n = returns.length;
+  if (n < 2) {
     return 0;
   }
 
   // Mean return
-  const meanReturn =
-    returns.reduce((sum, r) => sum + r, 0) / returns.length;
+  let sum = 0;
+  for (let i = 0; i < n; i++) {
+    sum += returns[i];
+  }
+  const meanReturn = sum / n;
 
   // Standard deviation (sample std dev with N-1)
-  const variance =
-    returns.reduce((sum, r) => sum + Math.pow(r - meanReturn, 2), 0) /
-    (returns.length - 1);
+  let sumSquaredDeviations = 0;
+  for (let i = 0; i < n; i++) {
+    const deviation = returns[i] - meanReturn;
+    sumSquaredDeviations += deviation * deviation;
+  }
+  const variance = sumSquaredDeviations / (n - 1);
   const stdDev = Math.sqrt(variance);
 
   if (stdDev === 0) {
@@ -835,16 +821,47 @@ function calculateSharpeRatio(
 }
 
 /**
- * Run Monte Carlo simulation
+ * Resample pool and worst-case trades shared by every simulation path
+ */
+interface PreparedSimulation {
+  /** Values to resample from (P&L or percentage returns) */
+  resamplePool: number[];
+
+  /** Number of trades/days available in the resample pool */
+  actualResamplePoolSize: number;
+
+  /** Whether pool values are percentage returns */
+  isPercentageMode: boolean;
+
+  /** Worst-case trades inserted into every path in "guarantee" mode */
+  enforcedGuaranteeTrades: number[];
+}
+
+/**
+ * Options for the non-blocking Monte Carlo runner
+ */
+export interface MonteCarloRunOptions {
+  /** Abort the run between batches of simulations */
+  signal?: AbortSignal;
+
+  /** Called after each batch with the number of completed simulations */
+  onProgress?: (completed: number, total: number) => void;
+}
+
+// Number of paths simulated between yields to the event loop
+const SIMULATIONS_PER_BATCH = 250;
+
+/**
+ * Validate inputs and build the resample pool for a Monte Carlo run
  *
  * @param trades - Historical trade data
  * @param params - Simulation parameters
- * @returns MonteCarloResult with all simulations and analysis
+ * @returns Inputs shared by every simulation path
  */
-export function runMonteCarloSimulation(
+function prepareSimulation(
   trades: Trade[],
   params: MonteCarloParams
-): MonteCarloResult {
+): PreparedSimulation {
   // Validate inputs
   if (trades.length < 10) {
     throw new Error(
@@ -852,8 +869,6 @@ export function runMonteCarloSimulation(
     );
   }
 
-  const timestamp = new Date();
-
   // Get resample pool based on method
   let resamplePool: number[];
   let actualResamplePoolSize: number;
@@ -975,66 +990,172 @@ export function runMonteCarloSimulation(
         )
       : [];
 
-  // Run all simulations
-  const simulations: SimulationPath[] = [];
-
-  for (let i = 0; i < params.numSimulations; i++) {
-    // Generate unique seed for each simulation if base seed provided
-    const seed = params.randomSeed !== undefined ? params.randomSeed + i : undefined;
-
-    // Resample P&Ls
-    const guaranteeActive = enforcedGuaranteeTrades.length > 0;
-    const baselineSampleSize = guaranteeActive
-      ? Math.max(0, params.simulationLength - enforcedGuaranteeTrades.length)
-      : params.simulationLength;
-
-    let resampledPLs = resampleWithReplacement(
-      resamplePool,
-      baselineSampleSize,
-      seed
-    );
-
-    if (guaranteeActive) {
-      const combined = [...resampledPLs];
-      const rng = seed !== undefined ? createSeededRandom(seed + 999999) : Math.random;
+  return {
+    resamplePool,
+    actualResamplePoolSize,
+    isPercentageMode,
+    enforcedGuaranteeTrades,
+  };
+}
 
-      for (const worstCase of enforcedGuaranteeTrades) {
-        const randomPosition = Math.floor(rng() * (combined.length + 1));
-        combined.splice(randomPosition, 0, worstCase);
-      }
+/**
+ * Resample and run the simulation path at the given index
+ *
+ * Each path is seeded from randomSeed + index, so paths can be produced in any
+ * batching without changing results.
+ *
+ * @param setup - Prepared resample pool and worst-case trades
+ * @param params - Simulation parameters
+ * @param index - Index of the path within the run
+ * @returns SimulationPath for this index
+ */
+function simulatePath(
+  setup: PreparedSimulation,
+  params: MonteCarloParams,
+  index: number
+): SimulationPath {
+  // Generate unique seed for each simulation if base seed provided
+  const seed = params.randomSeed !== undefined ? params.randomSeed + index : undefined;
+
+  // Resample P&Ls
+  const guaranteeActive = setup.enforcedGuaranteeTrades.length > 0;
+  const baselineSampleSize = guaranteeActive
+    ? Math.max(0, params.simulationLength - setup.enforcedGuaranteeTrades.length)
+    : params.simulationLength;
+
+  const resampledPLs = resampleWithReplacement(
+    setup.resamplePool,
+    baselineSampleSize,
+    seed
+  );
 
-      if (combined.length > params.simulationLength) {
-        combined.length = params.simulationLength;
-      }
+  if (guaranteeActive) {
+    // The resampled array is private to this path, so insert in place
+    // rather than copying it first
+    const rng = seed !== undefined ? createSeededRandom(seed + 999999) : Math.random;
 
-      resampledPLs = combined;
+    for (const worstCase of setup.enforcedGuaranteeTrades) {
+      const randomPosition = Math.floor(rng() * (resampledPLs.length + 1));
+      resampledPLs.splice(randomPosition, 0, worstCase);
     }
 
-    // Run simulation
-    const simulation = runSingleSimulation(
-      resampledPLs,
-      params.initialCapital,
-      params.tradesPerYear,
-      isPercentageMode
-    );
-
-    simulations.push(simulation);
+    if (resampledPLs.length > params.simulationLength) {
+      resampledPLs.length = params.simulationLength;
+    }
   }
 
+  // Run simulation
+  return runSingleSimulation(
+    resampledPLs,
+    params.initialCapital,
+    params.tradesPerYear,
+    setup.isPercentageMode
+  );
+}
+
+/**
+ * Assemble percentiles and statistics into the final result
+ *
+ * @param simulations - All simulation paths
+ * @param setup - Prepared resample pool
+ * @param params - Simulation parameters
+ * @param timestamp - When the run started
+ * @returns MonteCarloResult with all simulations and analysis
+ */
+function buildMonteCarloResult(
+  simulations: SimulationPath[],
+  setup: PreparedSimulation,
+  params: MonteCarloParams,
+  timestamp: Date
+): MonteCarloResult {
   // Calculate percentiles
   const percentiles = calculatePercentiles(simulations);
 
   // Calculate statistics
-  const statistics = calculateStatistics(simulations);
+  const { statistics, sortedTotalReturns, sortedMaxDrawdowns } =
+    calculateStatistics(simulations);
 
-  return {
+  const result: MonteCarloResult = {
     simulations,
     percentiles,
     statistics,
     parameters: params,
     timestamp,
-    actualResamplePoolSize,
+    actualResamplePoolSize: setup.actualResamplePoolSize,
   };
+
+  // The statistics pass already sorted these columns; hand them to the chart
+  // and card helpers so they don't extract and sort them again
+  sortedTotalReturnsCache.set(result, sortedTotalReturns);
+  sortedMaxDrawdownsCache.set(result, sortedMaxDrawdowns);
+
+  return result;
+}
+
+/**
+ * Run Monte Carlo simulation
+ *
+ * @param trades - Historical trade data
+ * @param params - Simulation parameters
+ * @returns MonteCarloResult with all simulations and analysis
+ */
+export function runMonteCarloSimulation(
+  trades: Trade[],
+  params: MonteCarloParams
+): MonteCarloResult {
+  const setup = prepareSimulation(trades, params);
+  const timestamp = new Date();
+
+  // Run all simulations
+  const simulations: SimulationPath[] = [];
+  for (let i = 0; i < params.numSimulations; i++) {
+    simulations.push(simulatePath(setup, params, i));
+  }
+
+  return buildMonteCarloResult(simulations, setup, params, timestamp);
+}
+
+/**
+ * Run Monte Carlo simulation without blocking the UI thread
+ *
+ * Produces the same result as runMonteCarloSimulation, but yields to the event
+ * loop between batches of simulations so the page can render progress.
+ *
+ * @param trades - Historical trade data
+ * @param params - Simulation parameters
+ * @param options - Optional abort signal and progress callback
+ * @returns MonteCarloResult with all simulations and analysis
+ */
+export async function runMonteCarloSimulationAsync(
+  trades: Trade[],
+  params: MonteCarloParams,
+  options: MonteCarloRunOptions = {}
+): Promise<MonteCarloResult> {
+  const setup = prepareSimulation(trades, params);
+  const timestamp = new Date();
+  const total = params.numSimulations;
+
+  const simulations: SimulationPath[] = [];
+  while (simulations.length < total) {
+    if (options.signal?.aborted) {
+      throw new Error("Monte Carlo simulation aborted");
+    }
+
+    const batchEnd = Math.min(total, simulations.length + SIMULATIONS_PER_BATCH);
+    for (let i = simulations.length; i < batchEnd; i++) {
+      simulations.push(simulatePath(setup, params, i));
+    }
+
+    options.onProgress?.(simulations.length, total);
+    await new Promise((resolve) => setTimeout(resolve, 0));
+  }
+
+  // The signal may have fired while yielding after the final batch
+  if (options.signal?.aborted) {
+    throw new Error("Monte Carlo simulation aborted");
+  }
+
+  return buildMonteCarloResult(simulations, setup, params, timestamp);
 }
 
 /**
@@ -1059,10 +1180,14 @@ function calculatePercentiles(
   const p75: number[] = [];
   const p95: number[] = [];
 
-  // For each step, collect all values at that step and calculate percentiles
+  // For each step, collect all values at that step into one reusable buffer,
+  // sort it once and read all five percentiles from the sorted column
+  const valuesAtStep = new Float64Array(simulations.length);
   for (let step = 0; step < simulationLength; step++) {
-    const valuesAtStep = simulations.map((sim) => sim.equityCurve[step]);
-    valuesAtStep.sort((a, b) => a - b);
+    for (let i = 0; i < simulations.length; i++) {
+      valuesAtStep[i] = simulations[i].equityCurve[step];
+    }
+    valuesAtStep.sort();
 
     p5.push(percentile(valuesAtStep, 5));
     p25.push(percentile(valuesAtStep, 25));
@@ -1081,7 +1206,7 @@ function calculatePercentiles(
  * @param p - Percentile to calculate (0-100)
  * @returns Percentile value
  */
-function percentile(sortedData: number[], p: number): number {
+function percentile(sortedData: ArrayLike<number>, p: number): number {
   if (sortedData.length === 0) {
     return 0;
   }
@@ -1102,69 +1227,80 @@ function percentile(sortedData: number[], p: number): number {
  * Calculate aggregate statistics from all simulations
  *
  * @param simulations - Array of simulation paths
- * @param initialCapital - Starting capital
- * @returns SimulationStatistics
+ * @returns SimulationStatistics plus the sorted return and drawdown columns
  */
-function calculateStatistics(simulations: SimulationPath[]): SimulationStatistics {
-  const finalValues = simulations.map((s) => s.finalValue);
-  const totalReturns = simulations.map((s) => s.totalReturn);
-  const annualizedReturns = simulations.map((s) => s.annualizedReturn);
-  const maxDrawdowns = simulations.map((s) => s.maxDrawdown);
-  const sharpeRatios = simulations.map((s) => s.sharpeRatio);
-
-  // Sort for percentile calculations
-  const sortedFinalValues = [...finalValues].sort((a, b) => a - b);
-  const sortedTotalReturns = [...totalReturns].sort((a, b) => a - b);
-
-  // Mean and median calculations
-  const meanFinalValue =
-    finalValues.reduce((sum, v) => sum + v, 0) / finalValues.length;
-  const medianFinalValue = percentile(sortedFinalValues, 50);
-
-  const meanTotalReturn =
-    totalReturns.reduce((sum, r) => sum + r, 0) / totalReturns.length;
-  const medianTotalReturn = percentile(sortedTotalReturns, 50);
-
-  const meanAnnualizedReturn =
-    annualizedReturns.reduce((sum, r) => sum + r, 0) /
-    annualizedReturns.length;
-  const medianAnnualizedReturn = percentile(
-    [...annualizedReturns].sort((a, b) => a - b),
-    50
-  );
-
-  const meanMaxDrawdown =
-    maxDrawdowns.reduce((sum, d) => sum + d, 0) / maxDrawdowns.length;
-  const medianMaxDrawdown = percentile(
-    [...maxDrawdowns].sort((a, b) => a - b),
-    50
-  );
+function calculateStatistics(simulations: SimulationPath[]): {
+  statistics: SimulationStatistics;
+  sortedTotalReturns: Float64Array;
+  sortedMaxDrawdowns: Float64Array;
+} {
+  const count = simulations.length;
+
+  // Gather each metric into a typed column and accumulate sums in one pass
+  const finalValues = new Float64Array(count);
+  const totalReturns = new Float64Array(count);
+  const annualizedReturns = new Float64Array(count);
+  const maxDrawdowns = new Float64Array(count);
+  let finalValueSum = 0;
+  let totalReturnSum = 0;
+  let annualizedReturnSum = 0;
+  let maxDrawdownSum = 0;
+  let sharpeRatioSum = 0;
+  let profitableSimulations = 0;
+
+  for (let i = 0; i < count; i++) {
+    const simulation = simulations[i];
+    finalValues[i] = simulation.finalValue;
+    totalReturns[i] = simulation.totalReturn;
+    annualizedReturns[i] = simulation.annualizedReturn;
+    maxDrawdowns[i] = simulation.maxDrawdown;
+
+    finalValueSum += simulation.finalValue;
+    totalReturnSum += simulation.totalReturn;
+    annualizedReturnSum += simulation.annualizedReturn;
+    maxDrawdownSum += simulation.maxDrawdown;
+    sharpeRatioSum += simulation.sharpeRatio;
+
+    // Probability of profit
+    if (simulation.totalReturn > 0) {
+      profitableSimulations++;
+    }
+  }
 
-  const meanSharpeRatio =
-    sharpeRatios.reduce((sum, s) => sum + s, 0) / sharpeRatios.length;
+  const meanFinalValue = finalValueSum / count;
+  const meanTotalReturn = totalReturnSum / count;
+  const meanAnnualizedReturn = annualizedReturnSum / count;
+  const meanMaxDrawdown = maxDrawdownSum / count;
+  const meanSharpeRatio = sharpeRatioSum / count;
+  const probabilityOfProfit = profitableSimulations / count;
+
+  // Standard deviation of final values (before the column is sorted)
+  let squaredDeviationSum = 0;
+  for (let i = 0; i < count; i++) {
+    const deviation = finalValues[i] - meanFinalValue;
+    squaredDeviationSum += deviation * deviation;
+  }
+  const stdFinalValue = Math.sqrt(squaredDeviationSum / (count - 1));
 
-  // Standard deviation of final values
-  const variance =
-    finalValues.reduce(
-      (sum, v) => sum + Math.pow(v - meanFinalValue, 2),
-      0
-    ) /
-    (finalValues.length - 1);
-  const stdFinalValue = Math.sqrt(variance);
+  // Sort the columns in place for percentile calculations
+  finalValues.sort();
+  totalReturns.sort();
+  annualizedReturns.sort();
+  maxDrawdowns.sort();
 
-  // Probability of profit
-  const profitableSimulations = totalReturns.filter((r) => r > 0).length;
-  const probabilityOfProfit =
-    profitableSimulations / totalReturns.length;
+  const medianFinalValue = percentile(finalValues, 50);
+  const medianTotalReturn = percentile(totalReturns, 50);
+  const medianAnnualizedReturn = percentile(annualizedReturns, 50);
+  const medianMaxDrawdown = percentile(maxDrawdowns, 50);
 
   // Value at Risk
   const valueAtRisk = {
-    p5: percentile(sortedTotalReturns, 5),
-    p10: percentile(sortedTotalReturns, 10),
-    p25: percentile(sortedTotalReturns, 25),
+    p5: percentile(totalReturns, 5),
+    p10: percentile(totalReturns, 10),
+    p25: percentile(totalReturns, 25),
   };
 
-  return {
+  const statistics: SimulationStatistics = {
     meanFinalValue,
     medianFinalValue,
     stdFinalValue,
@@ -1178,4 +1314,65 @@ function calculateStatistics(simulations: SimulationPath[]): SimulationStatistic
     probabilityOfProfit,
     valueAtRisk,
   };
+
+  return {
+    statistics,
+    sortedTotalReturns: totalReturns,
+    sortedMaxDrawdowns: maxDrawdowns,
+  };
+}
+
+// Sorted metric columns are shared by the statistics cards and the
+// distribution charts, so each is extracted and sorted at most once per result
+const sortedTotalReturnsCache = new WeakMap<MonteCarloResult, Float64Array>();
+const sortedMaxDrawdownsCache = new WeakMap<MonteCarloResult, Float64Array>();
+
+/**
+ * Get the total return of every simulation, sorted ascending
+ *
+ * The array is computed once per result and cached, so callers must not modify it.
+ *
+ * @param result - Monte Carlo result
+ * @returns Total returns as decimals (e.g., 0.5 = 50% gain) in ascending order
+ */
+export function getSortedTotalReturns(result: MonteCarloResult): Float64Array {
+  const cached = sortedTotalReturnsCache.get(result);
+  if (cached) {
+    return cached;
+  }
+
+  const { simulations } = result;
+  const totalReturns = new Float64Array(simulations.length);
+  for (let i = 0; i < simulations.length; i++) {
+    totalReturns[i] = simulations[i].totalReturn;
+  }
+  totalReturns.sort();
+
+  sortedTotalReturnsCache.set(result, totalReturns);
+  return totalReturns;
+}
+
+/**
+ * Get the maximum drawdown of every simulation, sorted ascending
+ *
+ * The array is computed once per result and cached, so callers must not modify it.
+ *
+ * @param result - Monte Carlo result
+ * @returns Max drawdowns as decimals (e.g., 0.2 = 20% drawdown) in ascending order
+ */
+export function getSortedMaxDrawdowns(result: MonteCarloResult): Float64Array {
+  const cached = sortedMaxDrawdownsCache.get(result);
+  if (cached) {
+    return cached;
+  }
+
+  const { simulations } = result;
+  const maxDrawdowns = new Float64Array(simulations.length);
+  for (let i = 0; i < simulations.length; i++) {
+    maxDrawdowns[i] = simulations[i].maxDrawdown;
+  }
+  maxDrawdowns.sort();
+
+  sortedMaxDrawdownsCache.set(result, maxDrawdowns);
+  return maxDrawdowns;
 }
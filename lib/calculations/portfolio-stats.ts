@@ -83,35 +83,50 @@ export class PortfolioStatsCalculator {
     // Debug logging removed for tests
 
     // Basic statistics
+    // Extract the P/L column once and split it by outcome in a single pass,
+    // rather than re-filtering and re-mapping the trade objects per metric
     const totalTrades = validTrades.length
-    const totalPl = validTrades.map(trade => trade.pl).reduce((sum, pl) => sum + pl, 0)
-    const totalCommissions = validTrades.reduce(
-      (sum, trade) => sum + trade.openingCommissionsFees + trade.closingCommissionsFees,
-      0
-    )
+    const winningPls: number[] = []
+    const losingPls: number[] = []
+    let breakEvenTrades = 0
+    let totalPl = 0
+    let totalCommissions = 0
+    let grossProfit = 0
+    let losingPlSum = 0
+
+    for (const trade of validTrades) {
+      const pl = trade.pl
+      totalPl += pl
+      totalCommissions += trade.openingCommissionsFees + trade.closingCommissionsFees
+
+      if (pl > 0) {
+        winningPls.push(pl)
+        grossProfit += pl
+      } else if (pl < 0) {
+        losingPls.push(pl)
+        losingPlSum += pl
+      } else {
+        breakEvenTrades++
+      }
+    }
+
     const netPl = totalPl - totalCommissions
 
     // Win/Loss analysis
-    const winningTradesList = validTrades.filter(trade => trade.pl > 0)
-    const losingTradesList = validTrades.filter(trade => trade.pl < 0)
-    const breakEvenTradesList = validTrades.filter(trade => trade.pl === 0)
-
-    const winRate = winningTradesList.length / totalTrades
-    const avgWin = winningTradesList.length > 0
-      ? mean(winningTradesList.map(trade => trade.pl)) as number
+    const winRate = winningPls.length / totalTrades
+    const avgWin = winningPls.length > 0
+      ? mean(winningPls) as number
       : 0
-    const avgLoss = losingTradesList.length > 0
-      ? mean(losingTradesList.map(trade => trade.pl)) as number
+    const avgLoss = losingPls.length > 0
+      ? mean(losingPls) as number
       : 0
 
     // Max win/loss - handle empty arrays
-    const plValues = validTrades.map(trade => trade.pl).filter(pl => typeof pl === 'number' && !isNaN(pl))
-    const maxWin = plValues.length > 0 && winningTradesList.length > 0 ? max(plValues.filter(pl => pl > 0)) as number : 0
-    const maxLoss = plValues.length > 0 && losingTradesList.length > 0 ? min(plValues.filter(pl => pl < 0)) as number : 0
+    const maxWin = winningPls.length > 0 ? max(winningPls) as number : 0
+    const maxLoss = losingPls.length > 0 ? min(losingPls) as number : 0
 
     // Profit factor (gross profit / gross loss)
-    const grossProfit = winningTradesList.reduce((sum, trade) => sum + trade.pl, 0)
-    const grossLoss = Math.abs(losingTradesList.reduce((sum, trade) => sum + trade.pl, 0))
+    const grossLoss = Math.abs(losingPlSum)
     const profitFactor = grossLoss > 0 ? grossProfit / grossLoss : grossProfit > 0 ? Infinity : 0
 
     // Drawdown calculation
@@ -144,9 +159,9 @@ export class PortfolioStatsCalculator {
     return {
       totalTrades,
       totalPl,
-      winningTrades: winningTradesList.length,
-      losingTrades: losingTradesList.length,
-      breakEvenTrades: breakEvenTradesList.length,
+      winningTrades: winningPls.length,
+      losingTrades: losingPls.length,
+      breakEvenTrades,
       winRate,
       avgWin,
       avgLoss,
@@ -243,24 +258,23 @@ export class PortfolioStatsCalculator {
 
     if (closedTrades.length === 0) return 0
 
-    // Sort trades by close date and time (legacy methodology)
-    const sortedTrades = [...closedTrades].sort((a, b) => {
-      try {
-        const dateA = new Date(a.dateClosed!)
-        const dateB = new Date(b.dateClosed!)
-
-        // Check for valid dates
-        if (isNaN(dateA.getTime()) || isNaN(dateB.getTime())) {
-          return 0
-        }
-
-        const dateCompare = dateA.getTime() - dateB.getTime()
-        if (dateCompare !== 0) return dateCompare
-        return (a.timeClosed || '').localeCompare(b.timeClosed || '')
-      } catch {
+    // Sort trades by close date and time (legacy methodology). Close times are
+    // parsed once up front rather than twice per comparison.
+    const keyedTrades = closedTrades.map(trade => ({
+      trade,
+      closedTime: new Date(trade.dateClosed!).getTime(),
+    }))
+    keyedTrades.sort((a, b) => {
+      // Check for valid dates
+      if (isNaN(a.closedTime) || isNaN(b.closedTime)) {
         return 0
       }
+
+      const dateCompare = a.closedTime - b.closedTime
+      if (dateCompare !== 0) return dateCompare
+      return (a.trade.timeClosed || '').localeCompare(b.trade.timeClosed || '')
     })
+    const sortedTrades = keyedTrades.map(({ trade }) => trade)
 
     // Calculate initial capital from first trade
     const firstTrade = sortedTrades[0]
@@ -753,24 +767,38 @@ export class PortfolioStatsCalculator {
 
     // Prefer daily log data when available for more accurate initial capital
     if (dailyLogEntries && dailyLogEntries.length > 0) {
-      const sortedEntries = [...dailyLogEntries].sort((a, b) =>
-        new Date(a.date).getTime() - new Date(b.date).getTime()
-      )
-      const firstEntry = sortedEntries[0]
+      // Only the earliest entry is needed, so scan for it instead of sorting a copy
+      // (strict comparison keeps the first of any same-day entries, like a stable sort)
+      let firstEntry = dailyLogEntries[0]
+      let firstTime = new Date(firstEntry.date).getTime()
+      for (let i = 1; i < dailyLogEntries.length; i++) {
+        const entryTime = new Date(dailyLogEntries[i].date).getTime()
+        if (entryTime < firstTime) {
+          firstEntry = dailyLogEntries[i]
+          firstTime = entryTime
+        }
+      }
       // Initial capital = Net Liquidity - Daily P/L
       // This accounts for any P/L that occurred on the first day
       return firstEntry.netLiquidity - firstEntry.dailyPl
     }
 
     // Fall back to trade-based calculation
-    // Sort trades chronologically
-    const sortedTrades = [...trades].sort((a, b) => {
-      const dateCompare = new Date(a.dateOpened).getTime() - new Date(b.dateOpened).getTime()
-      if (dateCompare !== 0) return dateCompare
-      return a.timeOpened.localeCompare(b.timeOpened)
-    })
+    // Find the chronologically first trade (date, then time opened)
+    let firstTrade = trades[0]
+    let firstTime = new Date(firstTrade.dateOpened).getTime()
+    for (let i = 1; i < trades.length; i++) {
+      const trade = trades[i]
+      const openedTime = new Date(trade.dateOpened).getTime()
+      if (
+        openedTime < firstTime ||
+        (openedTime === firstTime && trade.timeOpened.localeCompare(firstTrade.timeOpened) < 0)
+      ) {
+        firstTrade = trade
+        firstTime = openedTime
+      }
+    }
 
-    const firstTrade = sortedTrades[0]
     return firstTrade.fundsAtClose - firstTrade.pl
   }
 
@@ -38,6 +38,15 @@ export function calculateInitialCapitalFromTrades(trades: Trade[]): number {
   return initialCapital
 }
 
+/**
+ * Starting balance implied by the earliest daily log entry
+ */
+function initialCapitalFromFirstDailyLogEntry(firstEntry: DailyLogEntry): number {
+  // Initial capital = Net Liquidity - Daily P/L
+  // This accounts for any P/L that occurred on the first day
+  return firstEntry.netLiquidity - firstEntry.dailyPl
+}
+
 /**
  * Calculate initial capital from daily log data
  * Uses the earliest entry's net liquidity minus its daily P/L to get the starting balance
@@ -52,11 +61,7 @@ export function calculateInitialCapitalFromDailyLog(entries: DailyLogEntry[]): n
     new Date(a.date).getTime() - new Date(b.date).getTime()
   )
 
-  const firstEntry = sortedEntries[0]
-
-  // Initial capital = Net Liquidity - Daily P/L
-  // This accounts for any P/L that occurred on the first day
-  return firstEntry.netLiquidity - firstEntry.dailyPl
+  return initialCapitalFromFirstDailyLogEntry(sortedEntries[0])
 }
 
 /**
@@ -119,7 +124,6 @@ export function buildPortfolioTimeline(
     return []
   }
 
-  const initialCapital = calculateInitialCapital(trades, dailyLogEntries)
   const timeline: Array<{
     date: string
     portfolioValue: number
@@ -134,7 +138,11 @@ export function buildPortfolioTimeline(
       new Date(a.date).getTime() - new Date(b.date).getTime()
     )
 
-    sortedEntries.forEach(entry => {
+    // Same base as calculateInitialCapitalFromDailyLog, taken from the entries
+    // we just sorted instead of sorting them a second time
+    const initialCapital = initialCapitalFromFirstDailyLogEntry(sortedEntries[0])
+
+    for (const entry of sortedEntries) {
       timeline.push({
         date: new Date(entry.date).toISOString().split('T')[0],
         portfolioValue: entry.netLiquidity,
@@ -142,11 +150,13 @@ export function buildPortfolioTimeline(
         cumulativePl: entry.netLiquidity - initialCapital,
         source: 'daily_log',
       })
-    })
+    }
 
     return timeline
   }
 
+  const initialCapital = calculateInitialCapitalFromTrades(trades)
+
   // Otherwise build from trade data
   const tradesByDate = new Map<string, Trade[]>()
 
@@ -5,6 +5,7 @@
  * and AI-style insights for strategy × exit reason combinations.
  */
 
+import { selectTop } from '@/lib/utils';
 import { EnrichedTrade } from './tp_optimizer_mae_mfe_service';
 
 export interface StrategyExitHeatmapData {
@@ -216,14 +217,22 @@ export function generateAutoInsights3(
     byStrategy.get(strategy)!.push(trade);
   });
 
+  // Lowest-efficiency exit per strategy, found in one scan of the heatmap cells
+  // (first cell wins ties) instead of filtering the whole heatmap per strategy
+  const worstExitByStrategy = new Map<string, StrategyExitHeatmapData>();
+  for (const cell of heatmapData) {
+    const current = worstExitByStrategy.get(cell.strategy);
+    if (!current || cell.avg_efficiency < current.avg_efficiency) {
+      worstExitByStrategy.set(cell.strategy, cell);
+    }
+  }
+
   // Per-strategy insights
   const per_strategy_insights = Array.from(byStrategy.entries()).map(([strategy, stratTrades]) => {
     const avgEfficiency = stratTrades.reduce((sum, t) => sum + t.efficiency, 0) / stratTrades.length;
     const avgMissedProfit = stratTrades.reduce((sum, t) => sum + t.missed_profit_pct, 0) / stratTrades.length;
 
-    const worstExit = heatmapData
-      .filter((h) => h.strategy === strategy)
-      .reduce((prev, curr) => (curr.avg_efficiency < prev.avg_efficiency ? curr : prev));
+    const worstExit = worstExitByStrategy.get(strategy)!;
 
     const insight =
       avgMissedProfit > globalMissedProfit * 1.5
@@ -265,10 +274,8 @@ export function generateAutoInsights3(
     });
 
   // Top opportunities (highest missed profit + low efficiency)
-  const top_opportunities = heatmapData
-    .filter((h) => h.missed_profit_pct > globalMissedProfit * 1.2)
-    .sort((a, b) => b.missed_profit_pct - a.missed_profit_pct)
-    .slice(0, 3)
+  const opportunityCandidates = heatmapData.filter((h) => h.missed_profit_pct > globalMissedProfit * 1.2);
+  const top_opportunities = selectTop(opportunityCandidates, 3, (a, b) => b.missed_profit_pct - a.missed_profit_pct)
     .map((h) => ({
       strategy: h.strategy,
       exit_reason: h.exit_reason,
@@ -146,9 +146,9 @@ export function enrichTrades(trades: Trade[]): EnrichedTrade[] {
 }
 
 /**
- * Calculate strategy-level metrics
+ * Group trades by strategy in a single pass, keeping first-seen strategy order
  */
-export function calculateStrategyMetrics(enrichedTrades: EnrichedTrade[]): Map<string, StrategyMetrics> {
+export function groupTradesByStrategy(enrichedTrades: EnrichedTrade[]): Map<string, EnrichedTrade[]> {
   const byStrategy = new Map<string, EnrichedTrade[]>();
 
   enrichedTrades.forEach(trade => {
@@ -157,13 +157,27 @@ export function calculateStrategyMetrics(enrichedTrades: EnrichedTrade[]): Map<s
     byStrategy.set(trade.strategy, list);
   });
 
+  return byStrategy;
+}
+
+/**
+ * Calculate strategy-level metrics
+ *
+ * Pass `byStrategy` when the caller has already grouped the trades, so they
+ * are not grouped a second time.
+ */
+export function calculateStrategyMetrics(
+  enrichedTrades: EnrichedTrade[],
+  byStrategy: Map<string, EnrichedTrade[]> = groupTradesByStrategy(enrichedTrades)
+): Map<string, StrategyMetrics> {
   const metrics = new Map<string, StrategyMetrics>();
 
   byStrategy.forEach((trades, strategy) => {
     const avg_mfe = trades.reduce((sum, t) => sum + t.mfe_pct, 0) / trades.length;
     const avg_mae = trades.reduce((sum, t) => sum + t.mae_pct, 0) / trades.length;
     const avg_missed_profit = trades.reduce((sum, t) => sum + t.missed_profit_pct, 0) / trades.length;
-    const win_rate = (trades.filter(t => t.actual_pct > 0).length / trades.length) * 100;
+    const winners = trades.reduce((count, t) => count + (t.actual_pct > 0 ? 1 : 0), 0);
+    const win_rate = (winners / trades.length) * 100;
     const efficiency_score = trades.reduce((sum, t) => sum + t.efficiency, 0) / trades.length;
 
     // Recommended TP is the median optimal TP for the strategy
@@ -101,37 +101,36 @@ export async function buildPerformanceSnapshot(options: SnapshotOptions): Promis
     ? normalizeTradesToOneLot(options.trades)
     : options.trades
 
-  let filteredTrades = [...sourceTrades]
-  let filteredDailyLogs = normalizeTo1Lot
-    ? undefined
-    : options.dailyLogs
-      ? [...options.dailyLogs]
-      : undefined
-
-  if (dateRange?.from || dateRange?.to) {
+  // Filters below always produce new arrays, so the unfiltered inputs can be
+  // shared rather than copied into every snapshot kept in the store
+  let filteredTrades = sourceTrades
+  let filteredDailyLogs = normalizeTo1Lot ? undefined : options.dailyLogs
+
+  const hasDateRange = Boolean(dateRange?.from || dateRange?.to)
+  const allowedStrategies = strategies ? new Set(strategies) : undefined
+
+  // Apply the date range and strategy filters in a single pass over the trades
+  if (hasDateRange || allowedStrategies) {
     filteredTrades = filteredTrades.filter(trade => {
-      const tradeDate = new Date(trade.dateOpened)
-      if (dateRange.from && tradeDate < dateRange.from) return false
-      if (dateRange.to && tradeDate > dateRange.to) return false
-      return true
+      if (dateRange) {
+        const tradeDate = new Date(trade.dateOpened)
+        if (dateRange.from && tradeDate < dateRange.from) return false
+        if (dateRange.to && tradeDate > dateRange.to) return false
+      }
+      return !allowedStrategies || allowedStrategies.has(trade.strategy || 'Unknown')
     })
-
-    if (filteredDailyLogs) {
-      filteredDailyLogs = filteredDailyLogs.filter(entry => {
-        const entryDate = new Date(entry.date)
-        if (dateRange.from && entryDate < dateRange.from) return false
-        if (dateRange.to && entryDate > dateRange.to) return false
-        return true
-      })
-    }
   }
 
   if (strategies) {
-    filteredTrades = filteredTrades.filter(trade =>
-      strategies.includes(trade.strategy || 'Unknown')
-    )
-
+    // Daily logs describe the whole account, so they are dropped for strategy filters
     filteredDailyLogs = undefined
+  } else if (dateRange && hasDateRange && filteredDailyLogs) {
+    filteredDailyLogs = filteredDailyLogs.filter(entry => {
+      const entryDate = new Date(entry.date)
+      if (dateRange.from && entryDate < dateRange.from) return false
+      if (dateRange.to && entryDate > dateRange.to) return false
+      return true
+    })
   }
 
   const calculator = new PortfolioStatsCalculator({ riskFreeRate })
@@ -256,12 +255,12 @@ function buildEquityAndDrawdownFromDailyLogs(
     return { equityCurve: [], drawdownData: [] }
   }
 
-  const tradesSortedByClose = trades
-    .filter(trade => trade.dateClosed)
-    .sort((a, b) =>
-      new Date(a.dateClosed ?? a.dateOpened).getTime() -
-      new Date(b.dateClosed ?? b.dateOpened).getTime()
-    )
+  // Only the number of trades closed by each log date is needed, so keep the
+  // close timestamps as a packed numeric array instead of sorting trade objects
+  const closeTimes = Float64Array.from(
+    trades.filter(trade => trade.dateClosed),
+    trade => new Date(trade.dateClosed ?? trade.dateOpened).getTime()
+  ).sort()
 
   let closedTradeCount = 0
   let highWaterMark = Number.NEGATIVE_INFINITY
@@ -271,12 +270,11 @@ function buildEquityAndDrawdownFromDailyLogs(
 
   sortedLogs.forEach(entry => {
     const entryDate = new Date(entry.date)
+    const entryTime = entryDate.getTime()
 
     while (
-      closedTradeCount < tradesSortedByClose.length &&
-      new Date(
-        tradesSortedByClose[closedTradeCount].dateClosed ?? tradesSortedByClose[closedTradeCount].dateOpened
-      ).getTime() <= entryDate.getTime()
+      closedTradeCount < closeTimes.length &&
+      closeTimes[closedTradeCount] <= entryTime
     ) {
       closedTradeCount += 1
     }
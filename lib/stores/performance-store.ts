@@ -142,15 +142,17 @@ export const usePerformanceStore = create<PerformanceStore>((set, get) => ({
         getBlock
       } = await import('@/lib/db')
 
-      // Fetch block to get analysis config
-      const block = await getBlock(blockId)
+      // Block config, raw trades and daily logs are independent reads, so fetch them together
+      const [block, rawTrades, dailyLogs] = await Promise.all([
+        getBlock(blockId),
+        getTradesByBlock(blockId),
+        getDailyLogsByBlock(blockId)
+      ])
       const combineLegGroups = block?.analysisConfig?.combineLegGroups ?? false
 
-      const rawTrades = await getTradesByBlock(blockId)
       const trades = combineLegGroups
         ? await getTradesByBlockWithOptions(blockId, { combineLegGroups })
         : rawTrades
-      const dailyLogs = await getDailyLogsByBlock(blockId)
 
       const state = get()
       const normalizedStrategies = normalizeStrategyFilter(state.selectedStrategies, trades)
@@ -233,21 +235,25 @@ export const usePerformanceStore = create<PerformanceStore>((set, get) => ({
 export { processChartData } from '@/lib/services/performance-snapshot'
 
 function filterTradesForSnapshot(trades: Trade[], filters: SnapshotFilters): Trade[] {
-  let filtered = [...trades]
-
-  if (filters.dateRange?.from || filters.dateRange?.to) {
-    filtered = filtered.filter(trade => {
-      const tradeDate = new Date(trade.dateOpened)
-      if (filters.dateRange?.from && tradeDate < filters.dateRange.from) return false
-      if (filters.dateRange?.to && tradeDate > filters.dateRange.to) return false
-      return true
-    })
+  const { dateRange } = filters
+  const hasDateRange = Boolean(dateRange?.from || dateRange?.to)
+  const allowed = filters.strategies && filters.strategies.length > 0
+    ? new Set(filters.strategies)
+    : undefined
+
+  // Nothing to filter: share the input rather than copying it, as the
+  // snapshot service does
+  if (!hasDateRange && !allowed) {
+    return trades
   }
 
-  if (filters.strategies && filters.strategies.length > 0) {
-    const allowed = new Set(filters.strategies)
-    filtered = filtered.filter(trade => allowed.has(trade.strategy || 'Unknown'))
-  }
-
-  return filtered
+  // Single pass applying both criteria
+  return trades.filter(trade => {
+    if (dateRange && hasDateRange) {
+      const tradeDate = new Date(trade.dateOpened)
+      if (dateRange.from && tradeDate < dateRange.from) return false
+      if (dateRange.to && tradeDate > dateRange.to) return false
+    }
+    return !allowed || allowed.has(trade.strategy || 'Unknown')
+  })
 }
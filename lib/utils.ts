@@ -25,3 +25,49 @@ export function truncateStrategyName(
   }
   return `${strategyName.substring(0, maxLength)}...`
 }
+
+/**
+ * Returns the first `count` items in `compare` order without sorting the whole list.
+ *
+ * Equivalent to `[...items].sort(compare).slice(0, count)` (including stable
+ * ordering of ties), but keeps only a bounded buffer, so picking a handful of
+ * top entries from a long list is O(n × count) instead of O(n log n).
+ *
+ * @param items - Items to select from (not modified)
+ * @param count - Number of items to keep
+ * @param compare - Sort comparator, as passed to Array.prototype.sort
+ * @returns Up to `count` items in sorted order
+ *
+ * @example
+ * selectTop([5, 1, 4, 2], 2, (a, b) => b - a)
+ * // Returns: [5, 4]
+ */
+export function selectTop<T>(
+  items: readonly T[],
+  count: number,
+  compare: (a: T, b: T) => number
+): T[] {
+  const top: T[] = []
+  if (count <= 0) {
+    return top
+  }
+
+  for (const item of items) {
+    if (top.length === count && compare(item, top[top.length - 1]) >= 0) {
+      continue
+    }
+
+    // Insert after any equal items so ties keep their original order
+    let index = top.length
+    while (index > 0 && compare(item, top[index - 1]) < 0) {
+      index--
+    }
+    top.splice(index, 0, item)
+
+    if (top.length > count) {
+      top.pop()
+    }
+  }
+
+  return top
+}
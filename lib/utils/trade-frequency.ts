@@ -17,13 +17,16 @@ export function estimateTradesPerYear(
     return Math.max(MIN_TRADES_PER_YEAR, fallback);
   }
 
-  const sortedTrades = [...sampleTrades].sort(
-    (a, b) => a.dateOpened.getTime() - b.dateOpened.getTime()
-  );
+  // Only the date span matters, so scan for the bounds instead of sorting a copy
+  let firstTime = Infinity;
+  let lastTime = -Infinity;
+  for (const trade of sampleTrades) {
+    const openedTime = trade.dateOpened.getTime();
+    if (openedTime < firstTime) firstTime = openedTime;
+    if (openedTime > lastTime) lastTime = openedTime;
+  }
 
-  const firstDate = sortedTrades[0].dateOpened;
-  const lastDate = sortedTrades[sortedTrades.length - 1].dateOpened;
-  const daysElapsed = (lastDate.getTime() - firstDate.getTime()) / MS_PER_DAY;
+  const daysElapsed = (lastTime - firstTime) / MS_PER_DAY;
 
   if (daysElapsed <= 0) {
     return Math.max(MIN_TRADES_PER_YEAR, fallback);
@@ -146,6 +146,24 @@ describe('Correlation Calculations', () => {
     expect(result.correlationData[1][0]).toBeCloseTo(-0.39736, 5);
   });
 
+  it('should rank zero-filled series for spearman', () => {
+    const trades: Trade[] = [
+      { dateOpened: new Date('2025-01-01'), strategy: 'A', pl: 100 } as Trade,
+      { dateOpened: new Date('2025-01-03'), strategy: 'A', pl: 300 } as Trade,
+      { dateOpened: new Date('2025-01-02'), strategy: 'B', pl: 50 } as Trade,
+      { dateOpened: new Date('2025-01-03'), strategy: 'B', pl: 200 } as Trade,
+    ];
+
+    const result = calculateCorrelationMatrix(trades, {
+      method: 'spearman',
+      alignment: 'zero-pad',
+    });
+
+    // A = [100, 0, 300] -> ranks [2, 1, 3]; B = [0, 50, 200] -> ranks [1, 2, 3]
+    expect(result.correlationData[0][1]).toBeCloseTo(0.5, 10);
+    expect(result.correlationData[1][0]).toBeCloseTo(0.5, 10);
+  });
+
   it('should normalize by margin when requested', () => {
     const trades: Trade[] = [
       // Strategy1
@@ -238,4 +256,21 @@ describe('Correlation Calculations', () => {
 
     expect(analytics.averageCorrelation).toBeCloseTo(expectedAverage, 5);
   });
+
+  it('should report strongest and weakest pairs in analytics', () => {
+    const matrix = {
+      strategies: ['A', 'B', 'C'],
+      correlationData: [
+        [1, 0.5, -0.5],
+        [0.5, 1, 0.2],
+        [-0.5, 0.2, 1],
+      ],
+    };
+
+    const analytics = calculateCorrelationAnalytics(matrix);
+
+    expect(analytics.strongest).toEqual({ value: 0.5, pair: ['A', 'B'] });
+    expect(analytics.weakest).toEqual({ value: -0.5, pair: ['A', 'C'] });
+    expect(analytics.strategyCount).toBe(3);
+  });
 });
@@ -5,6 +5,7 @@
 import { Trade } from "@/lib/models/trade";
 import {
   runMonteCarloSimulation,
+  runMonteCarloSimulationAsync,
   getTradeResamplePool,
   calculateDailyReturns,
   getDailyResamplePool,
@@ -457,4 +458,54 @@ describe("Monte Carlo Simulation", () => {
       expect(result.simulations[0].sharpeRatio).toBeCloseTo(4.20936, 4);
     });
   });
+
+  describe("runMonteCarloSimulationAsync", () => {
+    const createAlternatingTrades = () =>
+      Array.from({ length: 20 }, (_, i) =>
+        createMockTrade({
+          id: `trade-${i}`,
+          pl: (i % 2 === 0 ? 100 : -50),
+          dateOpened: new Date(2024, 0, i + 1),
+        })
+      );
+
+    const createParams = (numSimulations: number): MonteCarloParams => ({
+      numSimulations,
+      simulationLength: 20,
+      resampleMethod: "trades",
+      initialCapital: 100000,
+      tradesPerYear: 252,
+      randomSeed: 42,
+    });
+
+    it("should match the synchronous runner when run in batches", async () => {
+      const trades = createAlternatingTrades();
+      const params = createParams(600);
+
+      const progress: number[] = [];
+      const asyncResult = await runMonteCarloSimulationAsync(trades, params, {
+        onProgress: (completed) => progress.push(completed),
+      });
+      const syncResult = runMonteCarloSimulation(trades, params);
+
+      expect(asyncResult.simulations).toEqual(syncResult.simulations);
+      expect(asyncResult.percentiles).toEqual(syncResult.percentiles);
+      expect(asyncResult.statistics).toEqual(syncResult.statistics);
+      expect(progress[progress.length - 1]).toBe(600);
+    });
+
+    it("should reject when aborted during the final batch", async () => {
+      const trades = createAlternatingTrades();
+      const params = createParams(100);
+
+      // A single-batch run can only be cancelled after its batch completes
+      const controller = new AbortController();
+      await expect(
+        runMonteCarloSimulationAsync(trades, params, {
+          signal: controller.signal,
+          onProgress: () => controller.abort(),
+        })
+      ).rejects.toThrow("Monte Carlo simulation aborted");
+    });
+  });
 });
@@ -0,0 +1,32 @@
+import { selectTop } from "@/lib/utils";
+
+describe("selectTop", () => {
+  const descending = (a: number, b: number) => b - a;
+
+  it("should match sort + slice for the requested count", () => {
+    const values = [3, 9, -2, 7, 7, 0, 12, 5, 1, 9];
+    expect(selectTop(values, 3, descending)).toEqual(
+      [...values].sort(descending).slice(0, 3)
+    );
+  });
+
+  it("should keep the original order of tied items", () => {
+    const items = [
+      { id: "a", score: 2 },
+      { id: "b", score: 5 },
+      { id: "c", score: 5 },
+      { id: "d", score: 1 },
+      { id: "e", score: 5 },
+    ];
+    const result = selectTop(items, 2, (a, b) => b.score - a.score);
+    expect(result.map((item) => item.id)).toEqual(["b", "c"]);
+  });
+
+  it("should return everything when count exceeds the list length", () => {
+    expect(selectTop([1, 3, 2], 10, descending)).toEqual([3, 2, 1]);
+  });
+
+  it("should return an empty list for a non-positive count", () => {
+    expect(selectTop([1, 2, 3], 0, descending)).toEqual([]);
+  });
+});